@@ -103,6 +103,11 @@ class HistogramDefaults(BaseModel):
     detector_3_enabled: bool = Field(default=True, description="Default state for detector 3 checkbox.")
     detector_4_enabled: bool = Field(default=True, description="Default state for detector 4 checkbox.")
 
+    @property
+    def detectors_enabled(self) -> tuple[bool, bool, bool, bool]:
+        """The detector checkbox defaults in order (detector 1 to 4)."""
+        return (self.detector_1_enabled, self.detector_2_enabled, self.detector_3_enabled, self.detector_4_enabled)
+
 
 class UIConfig(BaseModel):
     """Configuration for general user interface behavior."""
@@ -161,12 +166,14 @@ class AppConfig(BaseModel):
         """
         init_data = {}
         cameras_data = {}
+        camera_sections = []
 
         # First, populate the data for top-level models
         for section_name, section_data in config_dict.items():
             section_lower = section_name.lower()
 
             if section_lower.startswith("camera:"):
+                camera_sections.append((section_name, section_data))
                 continue  # Handle cameras in the next loop
 
             if section_lower == "app":
@@ -189,16 +196,15 @@ class AppConfig(BaseModel):
                 # You can log a warning here for unrecognized sections if you wish
                 pass
 
-        # Second, specifically parse the camera sections
-        for section_name, section_data in config_dict.items():
-            if section_name.lower().startswith("camera:"):
-                identifier = section_data.get("identifier")
-                if not identifier:
-                    # In a real app, you would log this warning
-                    print(f"Warning: Skipping camera section '{section_name}': missing 'identifier' field.")
-                    continue
-                # The dictionary key for `AppConfig.cameras` is the identifier.
-                cameras_data[identifier] = CameraConfig(**section_data)
+        # Second, parse the camera sections collected above
+        for section_name, section_data in camera_sections:
+            identifier = section_data.get("identifier")
+            if not identifier:
+                # In a real app, you would log this warning
+                print(f"Warning: Skipping camera section '{section_name}': missing 'identifier' field.")
+                continue
+            # The dictionary key for `AppConfig.cameras` is the identifier.
+            cameras_data[identifier] = CameraConfig(**section_data)
 
         init_data["cameras"] = cameras_data
 
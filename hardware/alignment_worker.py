@@ -165,6 +165,8 @@ class AlignmentWorker(QObject):
         """
         initial_x_v = piezo.get_voltage("x")
         initial_y_v = piezo.get_voltage("y")
+        x_min_v, x_max_v = piezo.get_voltage_limits("x")
+        y_min_v, y_max_v = piezo.get_voltage_limits("y")
         logger.info(f"Starting spiral scan on {piezo.port} from V(x,y)=({initial_x_v:.2f}, {initial_y_v:.2f})")
 
         max_power = -999.0
@@ -190,8 +192,8 @@ class AlignmentWorker(QObject):
             target_y_v = initial_y_v + (y_offset_nm * piezo.VOLTS_PER_NM)
 
             # Clamp to valid voltage range
-            clamped_x_v = max(piezo.get_min_voltage("x"), min(piezo.get_max_voltage("x"), target_x_v))
-            clamped_y_v = max(piezo.get_min_voltage("y"), min(piezo.get_max_voltage("y"), target_y_v))
+            clamped_x_v = max(x_min_v, min(x_max_v, target_x_v))
+            clamped_y_v = max(y_min_v, min(y_max_v, target_y_v))
 
             piezo.set_voltage("x", clamped_x_v)
             piezo.set_voltage("y", clamped_y_v)
@@ -203,7 +205,7 @@ class AlignmentWorker(QObject):
             if power > max_power:
                 max_power = power
                 best_x_v, best_y_v = clamped_x_v, clamped_y_v
-                logger.debug(f"New spiral max power: {max_power:.2f} dBm at V(x,y)=({best_x_v:.2f}, {best_y_v:.2f})")
+                logger.debug("New spiral max power: %.2f dBm at V(x,y)=(%.2f, %.2f)", max_power, best_x_v, best_y_v)
 
             # Increment spiral parameters for the next point
             point_num += 1
@@ -385,7 +387,7 @@ class AlignmentWorker(QObject):
                         absolute_max_power = current_power
                         absolute_max_pos_v = piezo.get_voltage(axis)
                         logger.debug(
-                            f"New ABSOLUTE max power: {absolute_max_power:.3f} dBm at {absolute_max_pos_v:.3f} V"
+                            "New ABSOLUTE max power: %.3f dBm at %.3f V", absolute_max_power, absolute_max_pos_v
                         )
 
                     # Second, decide if we should continue moving in this direction.
@@ -436,10 +438,8 @@ class AlignmentWorker(QObject):
             piezo_to_use = self.piezo_left if settings.stage_to_map == "left" else self.piezo_right
 
             # --- NEW: Get voltage limits ---
-            x_min_v = piezo_to_use.get_min_voltage("x")
-            x_max_v = piezo_to_use.get_max_voltage("x")
-            y_min_v = piezo_to_use.get_min_voltage("y")
-            y_max_v = piezo_to_use.get_max_voltage("y")
+            x_min_v, x_max_v = piezo_to_use.get_voltage_limits("x")
+            y_min_v, y_max_v = piezo_to_use.get_voltage_limits("y")
             logger.info(f"Voltage Limits: X=[{x_min_v:.2f}, {x_max_v:.2f}], Y=[{y_min_v:.2f}, {y_max_v:.2f}]")
 
             x_range_nm = np.arange(settings.x_min_nm, settings.x_max_nm + 1, settings.x_step_nm)
@@ -447,40 +447,37 @@ class AlignmentWorker(QObject):
             power_grid = np.zeros((len(x_range_nm), len(y_range_nm)))
 
             total_points = len(x_range_nm) * len(y_range_nm)
-            points_done = 0
 
             initial_x_v = piezo_to_use.get_voltage("x")
             initial_y_v = piezo_to_use.get_voltage("y")
             logger.info(f"Mapping started. Initial position: X={initial_x_v:.3f}V, Y={initial_y_v:.3f}V")
 
+            volts_per_nm = piezo_to_use.VOLTS_PER_NM
+            # Every row sweeps the same Y voltages; set_voltage_sequence clamps them to the axis limits.
+            y_line_v = initial_y_v + y_range_nm * volts_per_nm
+
             for i, x_offset_nm in enumerate(x_range_nm):
-                for j, y_offset_nm in enumerate(y_range_nm):
+                if not self._is_running:
+                    raise InterruptedError("Mapping cancelled by user.")
+
+                target_x_v = initial_x_v + (x_offset_nm * volts_per_nm)
+                # --- FIX: Clamp the target voltage to the allowed range ---
+                clamped_x_v = max(x_min_v, min(x_max_v, target_x_v))
+                if abs(clamped_x_v - target_x_v) > 0.001:
+                    logger.warning(
+                        f"Target X voltage out of range. Clamping. Target: {target_x_v:.2f}, Clamped: {clamped_x_v:.2f}"
+                    )
+                piezo_to_use.set_voltage("x", clamped_x_v)
+
+                def measure_point(j: int, _y_v: float, row: np.ndarray = power_grid[i], row_index: int = i):
                     if not self._is_running:
                         raise InterruptedError("Mapping cancelled by user.")
-
-                    volts_per_nm = piezo_to_use.VOLTS_PER_NM
-                    target_x_v = initial_x_v + (x_offset_nm * volts_per_nm)
-                    target_y_v = initial_y_v + (y_offset_nm * volts_per_nm)
-
-                    # --- FIX: Clamp the target voltage to the allowed range ---
-                    clamped_x_v = max(x_min_v, min(x_max_v, target_x_v))
-                    clamped_y_v = max(y_min_v, min(y_max_v, target_y_v))
-
-                    if abs(clamped_x_v - target_x_v) > 0.001 or abs(clamped_y_v - target_y_v) > 0.001:
-                        logger.warning(
-                            f"Target voltage out of range. Clamping. Target:({target_x_v:.2f}, {target_y_v:.2f}), Clamped:({clamped_x_v:.2f}, {clamped_y_v:.2f})"
-                        )
-
-                    piezo_to_use.set_voltage("x", clamped_x_v)
-                    piezo_to_use.set_voltage("y", clamped_y_v)
                     QThread.msleep(settings.settling_time_ms)
+                    row[j] = self._read_power(settings.samples_per_point)
+                    points_done = row_index * len(y_range_nm) + j + 1
+                    self.mapping_progress.emit(int(100 * points_done / total_points), total_points)
 
-                    power_val = self._read_power(settings.samples_per_point)
-                    power_grid[i, j] = power_val
-
-                    points_done += 1
-                    progress_percent = int(100 * points_done / total_points)
-                    self.mapping_progress.emit(progress_percent, total_points)
+                piezo_to_use.set_voltage_sequence("y", y_line_v, on_step=measure_point)
 
             logger.info("Mapping scan complete. Returning to initial position.")
             piezo_to_use.set_voltage("x", initial_x_v)
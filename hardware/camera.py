@@ -1,7 +1,7 @@
 import logging
 import time
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Any, TypeAlias
 
@@ -69,28 +69,106 @@ class FrameRateMonitor:
 
 
 class FrameBuffer:
-    """A thread-safe buffer to store the latest few frames from a camera."""
+    """A thread-safe triple buffer holding the latest frame from a camera.
 
-    def __init__(self, max_size: int = 3):
-        self.buffer: deque[np.ndarray] = deque(maxlen=max_size)
+    The producer (the Vimba callback) publishes into a back slot while the
+    consumer reads from a front slot; a third "ready" slot holds the most
+    recently published frame. Publishing and acquiring only swap slot indices
+    under the lock, so a reader copying a frame never stalls the producer.
+    Frames pushed out of the buffer are passed to `on_discard`, if given.
+    """
+
+    def __init__(self, on_discard: Callable[[np.ndarray], None] | None = None):
+        self._slots: list[np.ndarray | None] = [None, None, None]
+        self._on_discard = on_discard
+        self._back_idx = 0
+        self._ready_idx = 1
+        self._front_idx = 2
+        self._has_new_frame = False
         self.lock = QMutex()
 
     def add_frame(self, frame: np.ndarray):
-        """Adds a new frame to the buffer, evicting the oldest if full."""
+        """Publishes a new frame, replacing any frame not yet picked up by a reader."""
+        discarded = self._slots[self._back_idx]
+        self._slots[self._back_idx] = frame
         with QMutexLocker(self.lock):
-            self.buffer.append(frame)
+            self._back_idx, self._ready_idx = self._ready_idx, self._back_idx
+            self._has_new_frame = True
+        if discarded is not None and self._on_discard is not None:
+            self._on_discard(discarded)
 
     def get_latest_frame(self) -> np.ndarray | None:
         """Returns a copy of the most recent frame in the buffer."""
         with QMutexLocker(self.lock):
-            if not self.buffer:
-                return None
-            return self.buffer[-1].copy()
+            if self._has_new_frame:
+                self._front_idx, self._ready_idx = self._ready_idx, self._front_idx
+                self._has_new_frame = False
+            frame = self._slots[self._front_idx]
+        # The producer never writes the front slot, so the copy can run unlocked.
+        return None if frame is None else frame.copy()
 
     def clear(self):
         """Empties the buffer."""
         with QMutexLocker(self.lock):
-            self.buffer.clear()
+            self._slots = [None, None, None]
+            self._has_new_frame = False
+
+
+class FramePool:
+    """A small ring of reusable frame arrays for the Vimba callback.
+
+    Instead of allocating a fresh array for every frame, the producer writes into
+    a pooled array that all of its holders have released. Each array is handed out
+    together with the number of holders that will use it, and every holder calls
+    `release()` once when done. If every pooled array is still held, a new one is
+    allocated and replaces the oldest; its holders keep the old array, and their
+    late releases are ignored. A missed release only takes an array out of reuse.
+    """
+
+    def __init__(self, size: int = 4):
+        self._arrays: list[np.ndarray] = []
+        self._holders: list[int] = []
+        self._size = size
+        self._next_idx = 0
+        self._lock = QMutex()
+
+    def acquire(self, shape: tuple[int, ...], dtype: np.dtype, holders: int = 1) -> np.ndarray:
+        """Returns a free array of the given shape/dtype, now held by `holders` consumers."""
+        with QMutexLocker(self._lock):
+            count = len(self._arrays)
+            for _ in range(count):
+                idx = self._next_idx
+                self._next_idx = (idx + 1) % count
+                arr = self._arrays[idx]
+                if self._holders[idx] == 0 and arr.shape == shape and arr.dtype == dtype:
+                    self._holders[idx] = holders
+                    return arr
+
+            arr = np.empty(shape, dtype=dtype)
+            if count < self._size:
+                self._arrays.append(arr)
+                self._holders.append(holders)
+            else:
+                self._arrays[self._next_idx] = arr
+                self._holders[self._next_idx] = holders
+                self._next_idx = (self._next_idx + 1) % count
+            return arr
+
+    def release(self, arr: np.ndarray):
+        """Records that one holder is done with `arr`; arrays no longer in the pool are ignored."""
+        with QMutexLocker(self._lock):
+            for idx, pooled in enumerate(self._arrays):
+                if pooled is arr:
+                    if self._holders[idx] > 0:
+                        self._holders[idx] -= 1
+                    return
+
+    def clear(self):
+        """Drops all pooled arrays (e.g. when the camera closes)."""
+        with QMutexLocker(self._lock):
+            self._arrays.clear()
+            self._holders.clear()
+            self._next_idx = 0
 
 
 class VimbaCam(QObject):
@@ -115,7 +193,21 @@ class VimbaCam(QObject):
     """
 
     _DEFAULT_STREAM_BUFFER_COUNT = 5
+    _FRAME_POOL_SIZE = 4
     _RECOVERY_DELAY_MS = 500
+    # Features whose value bounds the range of others on GenICam cameras (the frame rate and
+    # exposure limit each other, the pixel format limits gain). Writing one drops cached ranges.
+    _RANGE_INPUT_FEATURES = frozenset(
+        {
+            "PixelFormat",
+            "ExposureTimeAbs",
+            "AcquisitionFrameRateAbs",
+            "BinningHorizontal",
+            "BinningVertical",
+            "Width",
+            "Height",
+        }
+    )
 
     new_frame = Signal(np.ndarray)
     fps_updated = Signal(float)
@@ -158,8 +250,15 @@ class VimbaCam(QObject):
         self._is_closing: bool = False
 
         self.frame_monitor = FrameRateMonitor()
-        self.frame_buffer = FrameBuffer(max_size=3)
+        self._frame_pool = FramePool(self._FRAME_POOL_SIZE)
+        # The frame buffer holds every pooled frame until it is pushed out, plus one hold
+        # per consumer registered with attach_frame_consumer().
+        self.frame_buffer = FrameBuffer(on_discard=self._frame_pool.release)
+        self._frame_consumers: list[Callable[[np.ndarray], None]] = []
         self.settings = CameraSettings()
+        # Feature (min, max) ranges, reused by the setters until a write to one of
+        # _RANGE_INPUT_FEATURES may have changed them (see _write_feature).
+        self._feature_ranges: dict[str, tuple[float, float]] = {}
         self.setObjectName(f"VimbaCam_{self.identifier}")
         logger.info(f"VimbaCam instance created for identifier: {self.identifier} (Name: {self.camera_name})")
 
@@ -225,12 +324,15 @@ class VimbaCam(QObject):
                     logger.warning(f"Handler {self.camera_name}: Frame from as_opencv_image() is None or empty.")
                     return
 
-                # Apply horizontal flip if configured
+                # Must own the pixels as the underlying buffer will be reused by Vimba.
+                # The copy (or flip) goes into a recycled array rather than a fresh allocation.
+                processed_image = self._frame_pool.acquire(
+                    current_image.shape, current_image.dtype, holders=1 + len(self._frame_consumers)
+                )
                 if self.flip_horizontal:
-                    current_image = cv2.flip(current_image, 1)
-
-                # Update frame buffer. Must copy as the underlying buffer will be reused by Vimba.
-                processed_image = current_image.copy()
+                    cv2.flip(current_image, 1, dst=processed_image)
+                else:
+                    np.copyto(processed_image, current_image)
                 self.frame_buffer.add_frame(processed_image)
 
                 # Emit signals for the GUI
@@ -249,6 +351,29 @@ class VimbaCam(QObject):
                 logger.error(f"Handler {self.camera_name}: CRITICAL - Failed to queue frame back: {e}")
                 self.error.emit(f"CRITICAL Frame queueing error: {e}")
 
+    # --- Frame Consumers ---
+    def attach_frame_consumer(self, slot: Callable[[np.ndarray], None]):
+        """
+        Connects `slot` to `new_frame` as a consumer that owns a hold on each frame.
+
+        The consumer must call `release_frame()` once for every frame it receives,
+        after which the array may be overwritten by a later frame. The hold is
+        counted before the connection exists, so a frame is never released early.
+        """
+        self._frame_consumers.append(slot)
+        self.new_frame.connect(slot)
+
+    def detach_frame_consumer(self, slot: Callable[[np.ndarray], None]):
+        """Disconnects a consumer registered with `attach_frame_consumer()`; unknown slots are ignored."""
+        if slot not in self._frame_consumers:
+            return
+        self.new_frame.disconnect(slot)
+        self._frame_consumers.remove(slot)
+
+    def release_frame(self, frame: np.ndarray):
+        """Hands a frame received through `attach_frame_consumer()` back for reuse."""
+        self._frame_pool.release(frame)
+
     # --- Open/Close and Configuration ---
     def open(self) -> bool:
         """Opens the camera and starts streaming."""
@@ -307,6 +432,8 @@ class VimbaCam(QObject):
                 self.disconnected.emit()
 
         self.frame_buffer.clear()
+        self._frame_pool.clear()
+        self._feature_ranges.clear()
         logger.info(f"Close sequence finished for camera: {self.camera_name}")
 
     @Slot()
@@ -358,7 +485,7 @@ class VimbaCam(QObject):
                 try:
                     feat = self.device.get_feature_by_name(name)
                     if feat.is_writeable():
-                        feat.set(value)
+                        self._write_feature(name, value)
                         logger.debug(f"Set {name} to {value}.")
                 except VmbCameraError as e:
                     logger.warning(f"Could not set feature '{name}': {e}")
@@ -371,9 +498,9 @@ class VimbaCam(QObject):
             try:
                 feat = self.device.get_feature_by_name("Gamma")
                 if feat.is_writeable():
-                    min_g, max_g = feat.get_range()
+                    min_g, max_g = self._cached_range("Gamma", feat)
                     target_gamma = max(min_g, min(max_g, 1.0))
-                    feat.set(target_gamma)
+                    self._write_feature("Gamma", target_gamma)
             except VmbCameraError:
                 logger.info("Gamma feature not available/writable.")
 
@@ -408,6 +535,7 @@ class VimbaCam(QObject):
             raise VmbCameraError("Could not find a supported mono or color format.")
 
         self.device.set_pixel_format(preferred_format)
+        self._feature_ranges.clear()  # Gain and exposure limits can depend on the pixel format
         self.settings.pixel_format = preferred_format
         self.is_mono = is_mono
         logger.info(f"Pixel format set to: {preferred_format.name}. Is Mono: {self.is_mono}")
@@ -469,11 +597,24 @@ class VimbaCam(QObject):
                 if not self.device:
                     return None
                 feat = self.device.get_feature_by_name(feature_name)
-                return feat.get_range() if feat.is_readable() else None
+                return self._cached_range(feature_name, feat) if feat.is_readable() else None
         except VmbCameraError as e:
             logger.warning(f"Could not get range for '{feature_name}': {e}")
             return None
 
+    def _cached_range(self, feature_name: str, feat: Any) -> tuple[float, float]:
+        """Returns the feature's (min, max) range, querying the camera only once. Call with the lock held."""
+        feature_range = self._feature_ranges.get(feature_name)
+        if feature_range is None:
+            feature_range = self._feature_ranges[feature_name] = feat.get_range()
+        return feature_range
+
+    def _write_feature(self, feature_name: str, value: Any) -> None:
+        """Writes a feature and drops the cached ranges it may have changed. Call with the lock held."""
+        self.device.get_feature_by_name(feature_name).set(value)
+        if feature_name in self._RANGE_INPUT_FEATURES:
+            self._feature_ranges.clear()
+
     def _get_feature_value(self, feature_name: str, cache_attr: str, default: Any) -> Any:
         """Generic private helper to get a feature's value and update the cache."""
         if not self.device:
@@ -498,17 +639,25 @@ class VimbaCam(QObject):
     def get_gamma(self) -> float:
         return self._get_feature_value("Gamma", "gamma", 1.0)
 
-    def _set_feature(self, func: Callable[[], Any], feature_name: str) -> bool:
-        """Generic private helper to execute a feature-setting function within a lock."""
+    def _set_feature(self, steps: Callable[[], Any] | Sequence[Callable[[], Any]], feature_name: str) -> bool:
+        """
+        Generic private helper to execute feature-setting steps under the lock.
+
+        Each step runs in its own short critical section, so getters on other
+        threads can interleave between e.g. disabling auto mode and writing the value.
+        """
         if not self.device:
             logger.warning(f"Cannot set {feature_name}: Camera not connected.")
             return False
+        if callable(steps):
+            steps = (steps,)
         try:
-            with QMutexLocker(self.lock):
-                if not self.device:
-                    return False
-                func()
-                return True
+            for step in steps:
+                with QMutexLocker(self.lock):
+                    if not self.device:
+                        return False
+                    step()
+            return True
         except VmbCameraError as e:
             error_msg = f"Error setting {feature_name}: {e}"
             logger.error(error_msg)
@@ -520,50 +669,89 @@ class VimbaCam(QObject):
             self.error.emit(error_msg)
             return False
 
+    def _clamped_setter_steps(
+        self, feature_name: str, value: float, auto_feature: str | None, on_set: Callable[[float], None]
+    ) -> list[Callable[[], Any]]:
+        """Builds the (disable auto, clamp, write) steps for a numeric feature."""
+        clamped: list[float] = []
+
+        def clamp():
+            min_val, max_val = self._cached_range(feature_name, self.device.get_feature_by_name(feature_name))
+            clamped.append(max(min_val, min(max_val, value)))
+
+        def write():
+            self._write_feature(feature_name, clamped[0])
+            on_set(clamped[0])
+
+        steps: list[Callable[[], Any]] = [clamp, write]
+        if auto_feature is not None:
+            steps.insert(0, lambda: self._write_feature(auto_feature, "Off"))
+        return steps
+
     def set_exposure(self, value_us: float) -> bool:
-        def action():
-            self.device.get_feature_by_name("ExposureAuto").set("Off")
-            feat = self.device.get_feature_by_name("ExposureTimeAbs")
-            min_val, max_val = feat.get_range()
-            set_val = max(min_val, min(max_val, value_us))
-            feat.set(set_val)
+        def on_set(set_val: float):
             self.settings.exposure_us = set_val
             self.settings.is_auto_exposure_on = False
 
-        return self._set_feature(action, "Exposure")
+        return self._set_feature(
+            self._clamped_setter_steps("ExposureTimeAbs", value_us, "ExposureAuto", on_set), "Exposure"
+        )
 
     def set_gain(self, value_db: float) -> bool:
-        def action():
-            self.device.get_feature_by_name("GainAuto").set("Off")
-            feat = self.device.get_feature_by_name("Gain")
-            min_val, max_val = feat.get_range()
-            set_val = max(min_val, min(max_val, value_db))
-            feat.set(set_val)
+        def on_set(set_val: float):
             self.settings.gain_db = set_val
             self.settings.is_auto_gain_on = False
 
-        return self._set_feature(action, "Gain")
+        return self._set_feature(self._clamped_setter_steps("Gain", value_db, "GainAuto", on_set), "Gain")
 
     def set_gamma(self, value: float) -> bool:
-        def action():
-            feat = self.device.get_feature_by_name("Gamma")
-            min_val, max_val = feat.get_range()
-            set_val = max(min_val, min(max_val, value))
-            feat.set(set_val)
+        def on_set(set_val: float):
             self.settings.gamma = set_val
 
-        return self._set_feature(action, "Gamma")
+        return self._set_feature(self._clamped_setter_steps("Gamma", value, None, on_set), "Gamma")
+
+    def apply_settings(self, settings: CameraSettings) -> bool:
+        """
+        Writes exposure, gain and gamma in a single locked pass.
+
+        Each value is clamped to its feature's current range, which avoids three
+        separate lock round trips when the GUI commits several parameters at once.
+        Auto exposure and auto gain are switched off.
+
+        Args:
+            settings: The target values; only exposure, gain and gamma are used.
+
+        Returns:
+            True if all values were written, False otherwise.
+        """
+        targets = (("ExposureTimeAbs", settings.exposure_us), ("Gain", settings.gain_db), ("Gamma", settings.gamma))
+
+        def action():
+            self._write_feature("ExposureAuto", "Off")
+            self._write_feature("GainAuto", "Off")
+            applied = []
+            for feature_name, value in targets:
+                # Looked up after the previous write, which may have moved this feature's range.
+                min_val, max_val = self._cached_range(feature_name, self.device.get_feature_by_name(feature_name))
+                clamped = max(min_val, min(max_val, value))
+                self._write_feature(feature_name, clamped)
+                applied.append(clamped)
+            self.settings.exposure_us, self.settings.gain_db, self.settings.gamma = applied
+            self.settings.is_auto_exposure_on = False
+            self.settings.is_auto_gain_on = False
+
+        return self._set_feature(action, "Camera Settings")
 
     def set_auto_exposure_once(self) -> bool:
         def action():
-            self.device.get_feature_by_name("ExposureAuto").set("Once")
+            self._write_feature("ExposureAuto", "Once")
             self.settings.is_auto_exposure_on = True
 
         return self._set_feature(action, "ExposureAuto Once")
 
     def set_auto_gain_once(self) -> bool:
         def action():
-            self.device.get_feature_by_name("GainAuto").set("Once")
+            self._write_feature("GainAuto", "Once")
             self.settings.is_auto_gain_on = True
 
         return self._set_feature(action, "GainAuto Once")
@@ -9,6 +9,7 @@ that the connection to the device is properly closed, even if errors occur.
 
 import ctypes
 import logging
+import threading
 from ctypes import (
     POINTER,
     Array,
@@ -22,11 +23,14 @@ from ctypes import (
     create_string_buffer,
 )
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 
 # Import the shared types from the new file
 from hardware.ct400_types import (
+    POWER_ARRAY_DETECTORS,
+    CT400StatusCode,
     Detector,
     Enable,
     LaserInput,
@@ -41,6 +45,90 @@ from hardware.interfaces import AbstractCT400
 # Module-level logger
 logger = logging.getLogger("LabApp.CT400")
 
+# Shared pointer types for the DLL signatures and scan arrays.
+_C_DOUBLE_P = POINTER(c_double)
+_C_INT32_P = POINTER(c_int32)
+
+# Fallback text per scan status code, used when the DLL leaves its error buffer empty.
+_STATUS_MESSAGES: dict[int, str] = {
+    code.value: f"Scan error: {code.name.removeprefix('SCAN_ERROR_').replace('_', ' ').lower()}" if code < 0 else ""
+    for code in CT400StatusCode
+}
+
+# Function definitions: (function_name, return_type, [arg_types...])
+_FUNC_DEFS: list[tuple[str, Any, list[Any]]] = [
+    ("CT400_Init", c_uint64, [_C_INT32_P]),
+    ("CT400_CheckConnected", c_int32, [c_uint64]),
+    ("CT400_GetNbInputs", c_int32, [c_uint64]),
+    ("CT400_GetNbDetectors", c_int32, [c_uint64]),
+    ("CT400_GetCT400Type", c_int32, [c_uint64]),
+    (
+        "CT400_ReadPowerDetectors",
+        c_int32,
+        [
+            c_uint64,
+            _C_DOUBLE_P,
+            _C_DOUBLE_P,
+            _C_DOUBLE_P,
+            _C_DOUBLE_P,
+            _C_DOUBLE_P,
+            _C_DOUBLE_P,
+        ],
+    ),
+    (
+        "CT400_SetLaser",
+        c_int32,
+        [
+            c_uint64,
+            c_int32,
+            c_int32,
+            c_int32,
+            c_int32,
+            c_double,
+            c_double,
+            c_int32,
+        ],
+    ),
+    (
+        "CT400_CmdLaser",
+        c_int32,
+        [c_uint64, c_int32, c_int32, c_double, c_double],
+    ),
+    ("CT400_SetSamplingResolution", c_int32, [c_uint64, c_uint32]),
+    (
+        "CT400_SetDetectorArray",
+        c_int32,
+        [c_uint64, c_int32, c_int32, c_int32, c_int32],
+    ),
+    ("CT400_SetBNC", c_int32, [c_uint64, c_int32, c_double, c_double, c_int32]),
+    ("CT400_SetScan", c_int32, [c_uint64, c_double, c_double, c_double]),
+    ("CT400_ScanStart", c_int32, [c_uint64]),
+    ("CT400_ScanStop", c_int32, [c_uint64]),
+    ("CT400_ScanWaitEnd", c_int32, [c_uint64, Array[c_char]]),
+    (
+        "CT400_GetNbDataPoints",
+        c_int32,
+        [c_uint64, _C_INT32_P, _C_INT32_P],
+    ),
+    ("CT400_GetNbDataPointsResampled", c_int32, [c_uint64]),
+    (
+        "CT400_ScanGetWavelengthResampledArray",
+        c_int32,
+        [c_uint64, _C_DOUBLE_P, c_int32],
+    ),
+    (
+        "CT400_ScanGetDetectorResampledArray",
+        c_int32,
+        [c_uint64, c_int32, _C_DOUBLE_P, c_int32],
+    ),
+    ("CT400_Close", c_int32, [c_uint64]),
+    (
+        "CT400_ScanSaveWavelengthSyncFile",
+        c_int32,
+        [c_uint64, POINTER(c_char)],
+    ),
+]
+
 
 # --- Custom Exceptions for Clear Error Reporting ---
 class CT400Error(Exception):
@@ -77,6 +165,10 @@ class CT400(AbstractCT400):
     """
 
     _ERROR_BUFFER_SIZE = 4096  # Increased for safety, as discussed.
+    _POWER_DETECTORS = POWER_ARRAY_DETECTORS
+    # Configured WinDLL objects keyed by resolved path, shared across instances.
+    _DLL_CACHE: dict[str, WinDLL] = {}
+    _DLL_CACHE_LOCK = threading.Lock()
 
     def __init__(self, dll_path: Path):
         """
@@ -89,20 +181,20 @@ class CT400(AbstractCT400):
             CT400InitializationError: If the DLL fails to load or the device fails
                                       to initialize.
         """
-        if not dll_path.exists():
-            logger.error(f"CT400 DLL not found at path: {dll_path}")
-            raise FileNotFoundError(f"CT400 DLL not found at: {dll_path}")
-        try:
-            # WinDLL needs a string path, so we convert back at the last moment.
-            self.dll = WinDLL(str(dll_path))
-        except OSError as e:
-            raise CT400InitializationError(
-                f"Failed to load DLL from {dll_path}. Ensure it is a valid 64-bit or 32-bit DLL matching your Python interpreter. Error: {e}"
-            ) from e
-        self._configure_function_signatures()
+        # The reused ctypes outputs below are shared by the monitor, scan and alignment worker
+        # threads; each lock covers the DLL call that fills a buffer and the read that empties it.
+        self._scan_error_buf = create_string_buffer(self._ERROR_BUFFER_SIZE)
+        self._scan_error_lock = threading.Lock()
+        # Output slots for CT400_ReadPowerDetectors (pout, p1..p4, vext), reused on every read.
+        self._power_scratch = tuple(c_double() for _ in range(6))
+        self._power_refs = tuple(byref(scratch) for scratch in self._power_scratch)
+        self._power_lock = threading.Lock()
+        # Reconnects reuse the already loaded and configured library.
+        self.dll = self.load_dll(dll_path)
+        self._bind_functions()
         # The CT400_Init function uses a pointer to an integer to return an error code.
         init_error = c_int32()
-        self.handle: int | None = self.dll.CT400_Init(byref(init_error))
+        self.handle: int | None = self._ct400_init(byref(init_error))
         if not self.handle:
             # --- REVISED EXCEPTION ---
             error_code = init_error.value
@@ -118,90 +210,56 @@ class CT400(AbstractCT400):
             )
         logger.info(f"CT400 Initialized successfully. Handle: {self.handle}")
 
-    def _configure_function_signatures(self):
+    @classmethod
+    def load_dll(cls, dll_path: Path) -> WinDLL:
+        """
+        Loads and configures the CT400 DLL, once per resolved path.
+        Later calls (reconnects, or a pre-warm from the init worker) return the
+        cached library without touching the filesystem loader again.
+        Raises:
+            FileNotFoundError: If the DLL file cannot be found at the specified path.
+            CT400InitializationError: If the DLL fails to load.
+        """
+        if not dll_path.exists():
+            logger.error(f"CT400 DLL not found at path: {dll_path}")
+            raise FileNotFoundError(f"CT400 DLL not found at: {dll_path}")
+        cache_key = str(dll_path.resolve())
+        with cls._DLL_CACHE_LOCK:
+            dll = cls._DLL_CACHE.get(cache_key)
+            if dll is None:
+                try:
+                    # WinDLL needs a string path, so we convert back at the last moment.
+                    dll = WinDLL(cache_key)
+                except OSError as e:
+                    raise CT400InitializationError(
+                        f"Failed to load DLL from {dll_path}. Ensure it is a valid 64-bit or 32-bit DLL matching your Python interpreter. Error: {e}"
+                    ) from e
+                cls._configure_function_signatures(dll)
+                cls._DLL_CACHE[cache_key] = dll
+        return dll
+
+    @staticmethod
+    def _configure_function_signatures(dll: WinDLL):
         """
         Configures the argument and return types for all DLL functions.
         This is crucial for ctypes to correctly handle data types and prevent errors.
-        This declarative list makes it easy to verify against the C header file.
-        """
-        # Function definitions: (function_name, return_type, [arg_types...])
-        func_defs = [
-            ("CT400_Init", c_uint64, [POINTER(c_int32)]),
-            ("CT400_CheckConnected", c_int32, [c_uint64]),
-            ("CT400_GetNbInputs", c_int32, [c_uint64]),
-            ("CT400_GetNbDetectors", c_int32, [c_uint64]),
-            ("CT400_GetCT400Type", c_int32, [c_uint64]),
-            (
-                "CT400_ReadPowerDetectors",
-                c_int32,
-                [
-                    c_uint64,
-                    POINTER(c_double),
-                    POINTER(c_double),
-                    POINTER(c_double),
-                    POINTER(c_double),
-                    POINTER(c_double),
-                    POINTER(c_double),
-                ],
-            ),
-            (
-                "CT400_SetLaser",
-                c_int32,
-                [
-                    c_uint64,
-                    c_int32,
-                    c_int32,
-                    c_int32,
-                    c_int32,
-                    c_double,
-                    c_double,
-                    c_int32,
-                ],
-            ),
-            (
-                "CT400_CmdLaser",
-                c_int32,
-                [c_uint64, c_int32, c_int32, c_double, c_double],
-            ),
-            ("CT400_SetSamplingResolution", c_int32, [c_uint64, c_uint32]),
-            (
-                "CT400_SetDetectorArray",
-                c_int32,
-                [c_uint64, c_int32, c_int32, c_int32, c_int32],
-            ),
-            ("CT400_SetBNC", c_int32, [c_uint64, c_int32, c_double, c_double, c_int32]),
-            ("CT400_SetScan", c_int32, [c_uint64, c_double, c_double, c_double]),
-            ("CT400_ScanStart", c_int32, [c_uint64]),
-            ("CT400_ScanStop", c_int32, [c_uint64]),
-            ("CT400_ScanWaitEnd", c_int32, [c_uint64, Array[c_char]]),
-            (
-                "CT400_GetNbDataPoints",
-                c_int32,
-                [c_uint64, POINTER(c_int32), POINTER(c_int32)],
-            ),
-            ("CT400_GetNbDataPointsResampled", c_int32, [c_uint64]),
-            (
-                "CT400_ScanGetWavelengthResampledArray",
-                c_int32,
-                [c_uint64, POINTER(c_double), c_int32],
-            ),
-            (
-                "CT400_ScanGetDetectorResampledArray",
-                c_int32,
-                [c_uint64, c_int32, POINTER(c_double), c_int32],
-            ),
-            ("CT400_Close", c_int32, [c_uint64]),
-            (
-                "CT400_ScanSaveWavelengthSyncFile",
-                c_int32,
-                [c_uint64, POINTER(c_char)],
-            ),
-        ]
-        for name, restype, argtypes in func_defs:
-            func = getattr(self.dll, name)
+        The declarative `_FUNC_DEFS` list makes it easy to verify against the C header file.
+
+        Note: functions loaded through `WinDLL` already release the GIL for the
+        duration of every call, so blocking calls such as `CT400_ScanWaitEnd` or
+        the resampled-array reads do not stall other Python threads. They must
+        still be issued from a worker thread, never from the Qt GUI thread.
+        """
+        for name, restype, argtypes in _FUNC_DEFS:
+            func = getattr(dll, name)
             func.restype = restype
             func.argtypes = argtypes
 
+    def _bind_functions(self):
+        """Binds each DLL function once (e.g. `self._ct400_checkconnected`) so hot paths skip the attribute lookup."""
+        for name, _restype, _argtypes in _FUNC_DEFS:
+            setattr(self, "_" + name.lower(), getattr(self.dll, name))
+
     def _check_rc(self, return_code: int, error_message: str):
         """
         Private helper to check the return code of a DLL function.
@@ -216,6 +274,17 @@ class CT400(AbstractCT400):
             logger.error(f"CT400 API Error: {error_message} (Return Code: {return_code})")
             raise CT400CommunicationError(error_message)
 
+    def _check_open(self):
+        """
+        Private helper to guard DLL calls after `close()`.
+        The handle doubles as the "closed" sentinel, so a closed wrapper fails
+        fast with a clear error instead of passing a stale handle to the DLL.
+        Raises:
+            CT400CommunicationError: If the connection has already been closed.
+        """
+        if self.handle is None:
+            raise CT400CommunicationError("CT400 connection is closed.")
+
     # --- Public API Methods ---
     def is_connected(self) -> bool:
         """
@@ -223,7 +292,9 @@ class CT400(AbstractCT400):
         Returns:
             True if the device is connected, False otherwise.
         """
-        return bool(self.dll.CT400_CheckConnected(self.handle))
+        if self.handle is None:
+            return False
+        return bool(self._ct400_checkconnected(self.handle))
 
     def get_number_inputs(self) -> int:
         """
@@ -233,7 +304,8 @@ class CT400(AbstractCT400):
         Raises:
             CT400CommunicationError: If the query to the device fails.
         """
-        result = self.dll.CT400_GetNbInputs(self.handle)
+        self._check_open()
+        result = self._ct400_getnbinputs(self.handle)
         self._check_rc(result, "Failed to get the number of available inputs")
         return result
 
@@ -245,7 +317,8 @@ class CT400(AbstractCT400):
         Raises:
             CT400CommunicationError: If the query to the device fails.
         """
-        result = self.dll.CT400_GetNbDetectors(self.handle)
+        self._check_open()
+        result = self._ct400_getnbdetectors(self.handle)
         self._check_rc(result, "Failed to get the number of available detectors")
         return result
 
@@ -258,7 +331,8 @@ class CT400(AbstractCT400):
         Raises:
             CT400CommunicationError: If the query to the device fails.
         """
-        result = self.dll.CT400_GetCT400Type(self.handle)
+        self._check_open()
+        result = self._ct400_getct400type(self.handle)
         self._check_rc(result, "Failed to get the CT400 device type")
         return result
 
@@ -284,12 +358,13 @@ class CT400(AbstractCT400):
         Raises:
             CT400CommunicationError: If setting the configuration fails.
         """
-        result = self.dll.CT400_SetLaser(
+        self._check_open()
+        result = self._ct400_setlaser(
             self.handle,
-            laser_input.value,
-            enable.value,
+            laser_input,
+            enable,
             gpib_address,
-            laser_type.value,
+            laser_type,
             min_wavelength,
             max_wavelength,
             speed,
@@ -306,51 +381,61 @@ class CT400(AbstractCT400):
         """
         Sends a command to a configured laser, such as setting its wavelength and power.
         """
-        logger.debug(f"Executing CmdLaser: Input={laser_input.name}, En={enable.name}, WL={wavelength}, P={power}")
-        result = self.dll.CT400_CmdLaser(
-            self.handle,
-            laser_input.value,
-            enable.value,
-            wavelength,
-            power,
+        self._check_open()
+        logger.debug(
+            "Executing CmdLaser: Input=%s, En=%s, WL=%s, P=%s", laser_input.name, enable.name, wavelength, power
         )
-        self._check_rc(result, f"Failed to send command to laser on input {laser_input.name}")
+        self._cmd_laser_fast(laser_input, enable, wavelength, power)
+
+    def _cmd_laser_fast(self, laser_input: int, enable: int, wavelength: float, power: float) -> None:
+        """
+        Low-overhead CmdLaser for sweep loops: no closed-handle check and no logging.
+        IntEnum members are ints, so `LaserInput`/`Enable` values can be passed as-is.
+        """
+        result = self._ct400_cmdlaser(self.handle, laser_input, enable, wavelength, power)
+        if result == -1:
+            self._check_rc(result, f"Failed to send command to laser on input {laser_input}")
 
     def set_sampling_res(self, resolution_pm: int) -> None:
         """
         Configures the sampling resolution for wavelength scans.
         """
-        result = self.dll.CT400_SetSamplingResolution(self.handle, resolution_pm)
+        self._check_open()
+        result = self._ct400_setsamplingresolution(self.handle, resolution_pm)
         self._check_rc(result, f"Failed to set sample resolution to {resolution_pm} pm")
 
     def set_detector_array(self, det2: Enable, det3: Enable, det4: Enable, ext: Enable) -> None:
         """
         Configures which detectors are active during a scan.
         """
-        result = self.dll.CT400_SetDetectorArray(self.handle, det2.value, det3.value, det4.value, ext.value)
+        self._check_open()
+        result = self._ct400_setdetectorarray(self.handle, det2, det3, det4, ext)
         self._check_rc(result, "Failed to set detector array configuration")
 
     def set_bnc(self, enable: Enable, alpha: float, beta: float, unit: Unit) -> None:
         """
         Configures the external BNC detector input, including scaling and units.
         """
-        result = self.dll.CT400_SetBNC(self.handle, enable.value, alpha, beta, unit.value)
+        self._check_open()
+        result = self._ct400_setbnc(self.handle, enable, alpha, beta, unit)
         self._check_rc(result, "Failed to set external BNC detector configuration")
 
     def set_scan(self, laser_power: float, min_wavelength: float, max_wavelength: float) -> None:
         """
         Configures the primary parameters for a wavelength scan.
         """
-        logger.debug(f"Setting scan: P={laser_power}, MinWL={min_wavelength}, MaxWL={max_wavelength}")
-        result = self.dll.CT400_SetScan(self.handle, laser_power, min_wavelength, max_wavelength)
+        self._check_open()
+        logger.debug("Setting scan: P=%s, MinWL=%s, MaxWL=%s", laser_power, min_wavelength, max_wavelength)
+        result = self._ct400_setscan(self.handle, laser_power, min_wavelength, max_wavelength)
         self._check_rc(result, "Failed to set scan configuration")
 
     def start_scan(self) -> None:
         """
         Starts the pre-configured wavelength scan. This is a non-blocking call.
         """
+        self._check_open()
         logger.debug("Starting scan...")
-        result = self.dll.CT400_ScanStart(self.handle)
+        result = self._ct400_scanstart(self.handle)
         self._check_rc(result, "Failed to start scan")
         logger.info("Scan started successfully.")
 
@@ -358,33 +443,44 @@ class CT400(AbstractCT400):
         """
         Stops an ongoing wavelength scan. This is a safe-to-call function.
         """
-        result = self.dll.CT400_ScanStop(self.handle)
+        if self.handle is None:
+            logger.warning("CT400_ScanStop skipped: the connection is already closed.")
+            return
+        result = self._ct400_scanstop(self.handle)
         if result == -1:
             logger.warning("CT400_ScanStop returned an error. The scan might have already finished or failed.")
 
     def scan_wait_end(self) -> tuple[int, str]:
         """
         Waits for the scan to end or polls its current status.
-        This implementation creates and manages the ctypes error buffer internally,
+        This implementation manages the ctypes error buffer internally,
         preventing it from leaking into other application layers and mitigating
         the risk of buffer overflows by decoding safely.
         Returns:
             A tuple containing the raw status code and the decoded error message.
         """
-        # Buffer is now an implementation detail, not part of the interface.
-        error_buf = create_string_buffer(self._ERROR_BUFFER_SIZE)  # A reasonable size
-        result = self.dll.CT400_ScanWaitEnd(self.handle, error_buf)
+        self._check_open()
+        # Buffer is an implementation detail, reused across polls; the DLL only fills it on errors.
+        error_buf = self._scan_error_buf
+        with self._scan_error_lock:
+            error_buf[0] = b"\x00"
+            result = self._ct400_scanwaitend(self.handle, error_buf)
+            if result >= 0:
+                # Fast path while polling: running/completed, no message to decode.
+                return result, _STATUS_MESSAGES.get(result, "")
+            raw_msg = error_buf.value
         # Safely decode the buffer.
-        error_msg = ""
         try:
             # The value attribute is a bytes object, decode it.
-            error_msg = error_buf.value.decode("utf-8", errors="ignore").strip("\x00")
+            error_msg = raw_msg.decode("utf-8", errors="ignore").strip("\x00")
         except Exception as e:
             logger.error(f"Failed to decode error buffer from CT400_ScanWaitEnd: {e}")
             error_msg = "Could not decode error message from device."
-        if result < 0 and result != -1:  # Specific documented error codes
+        if not error_msg:
+            error_msg = _STATUS_MESSAGES.get(result, f"Unknown scan error (code {result}).")
+        if result != -1:  # Specific documented error codes
             logger.error(f"CT400 Scan Error (Code: {result}): {error_msg}")
-        elif result == -1:  # A general failure of the function call itself
+        else:  # A general failure of the function call itself
             # This is a special case. -1 means the function call itself failed,
             # whereas other negative numbers are specific scan error codes.
             raise CT400CommunicationError(
@@ -395,56 +491,53 @@ class CT400(AbstractCT400):
     def get_data_points(self, dets_used: list[Detector]) -> tuple[np.ndarray, np.ndarray]:
         """
         Retrieves the resampled wavelength and power data after a scan has completed.
+        Both arrays are freshly allocated and owned by the caller.
         """
+        self._check_open()
         # Get the number of resampled data points available.
-        num_points = self.dll.CT400_GetNbDataPointsResampled(self.handle)
+        num_points = self._ct400_getnbdatapointsresampled(self.handle)
         self._check_rc(num_points, "Failed to get the number of resampled data points")
         if num_points <= 0:
             logger.warning(f"Scan reported {num_points} resampled data points. Returning empty arrays.")
-            return np.array([]), np.empty((len(dets_used), 0))
+            return np.empty(0, dtype=np.float64), np.empty((len(dets_used), 0), dtype=np.float64)
         logger.info(f"Retrieving {num_points} resampled data points.")
+        wavelengths = np.empty(num_points, dtype=np.float64)
+        det_pows = np.empty((len(dets_used), num_points), dtype=np.float64)
         # --- Retrieve Wavelength Data ---
-        wl_buffer = (c_double * num_points)()
-        result = self.dll.CT400_ScanGetWavelengthResampledArray(self.handle, wl_buffer, num_points)
+        # The DLL writes straight into the NumPy arrays, so no intermediate ctypes buffers are needed.
+        wl_ptr = wavelengths.ctypes.data_as(_C_DOUBLE_P)
+        result = self._ct400_scangetwavelengthresampledarray(self.handle, wl_ptr, num_points)
         self._check_rc(result, "Failed to retrieve resampled wavelength data")
-        wavelengths = np.ctypeslib.as_array(wl_buffer)
         # --- Retrieve Power Data for Each Requested Detector ---
-        det_pows = np.empty((len(dets_used), num_points), dtype=float)
-        pow_buffer = (c_double * num_points)()  # Re-use this buffer for each detector call
-        for i, det in enumerate(dets_used):
-            result_det = self.dll.CT400_ScanGetDetectorResampledArray(
-                self.handle,
-                det.value,
-                pow_buffer,
-                num_points,
-            )
-            self._check_rc(result_det, f"Failed to get resampled data for detector {det.name}")
-            # Important: Copy the data from the buffer immediately.
-            det_pows[i, :] = np.ctypeslib.as_array(pow_buffer).copy()
+        row_ptrs = [row.ctypes.data_as(_C_DOUBLE_P) for row in det_pows]
+        self._batch_get_detectors(dets_used, row_ptrs, num_points)
         return wavelengths, det_pows
 
+    def _batch_get_detectors(self, dets_used: list[Detector], row_ptrs: list[Any], num_points: int) -> None:
+        """
+        Fills the rows of the detector power array, one DLL call per detector.
+        The DLL only exposes a per-detector read, so this keeps the Python side
+        of the loop minimal: bound function and handle in locals, and error
+        messages formatted only on failure.
+        """
+        get_detector_array = self._ct400_scangetdetectorresampledarray
+        handle = self.handle
+        for det, row_ptr in zip(dets_used, row_ptrs):
+            if get_detector_array(handle, det, row_ptr, num_points) == -1:
+                self._check_rc(-1, f"Failed to get resampled data for detector {det.name}")
+
     def get_all_powers(self) -> PowerData:
         """
         Reads the instantaneous power values from all configured detectors.
         """
-        pout, p1, p2, p3, p4, vext = (c_double() for _ in range(6))
-        result = self.dll.CT400_ReadPowerDetectors(
-            self.handle,
-            byref(pout),
-            byref(p1),
-            byref(p2),
-            byref(p3),
-            byref(p4),
-            byref(vext),
-        )
-        self._check_rc(result, "Failed to read instantaneous power from detectors")
-        detectors_dict = {
-            Detector.DE_1: p1.value,
-            Detector.DE_2: p2.value,
-            Detector.DE_3: p3.value,
-            Detector.DE_4: p4.value,
-        }
-        return PowerData(pout=pout.value, detectors=detectors_dict)
+        # Hot path for live monitoring: checks are inlined, helpers only run on failure.
+        if self.handle is None:
+            self._check_open()
+        with self._power_lock:
+            if self._ct400_readpowerdetectors(self.handle, *self._power_refs) == -1:
+                self._check_rc(-1, "Failed to read instantaneous power from detectors")
+            pout, p1, p2, p3, p4, _vext = (scratch.value for scratch in self._power_scratch)
+        return PowerData(pout=pout, detectors=dict(zip(self._POWER_DETECTORS, (p1, p2, p3, p4))))
 
     def save_scan_wavelength_sync_file(self, path: str | Path) -> Path:
         """
@@ -460,13 +553,14 @@ class CT400(AbstractCT400):
         Path
             The actual file path written (may differ if the DLL modifies it).
         """
+        self._check_open()
         path = Path(path).resolve()
         logger.debug(f"Saving scan wavelength sync file to {path}")
 
         # Convert to mutable C buffer (in/out string)
         path_buffer = ctypes.create_string_buffer(str(path).encode("utf-8"), 512)
 
-        result = self.dll.CT400_ScanSaveWavelengthSyncFile(ctypes.c_uint64(self.handle), path_buffer)
+        result = self._ct400_scansavewavelengthsyncfile(ctypes.c_uint64(self.handle), path_buffer)
 
         self._check_rc(result, "Failed to save scan wavelength sync file")
 
@@ -483,7 +577,7 @@ class CT400(AbstractCT400):
         It will also attempt to safely turn off the laser.
         """
         if self.handle is not None:
-            logger.info(f"Closing connection to CT400 (Handle: {self.handle})...")
+            logger.info("Closing connection to CT400 (Handle: %s)...", self.handle)
             try:
                 # --- NEW: Safely turn off laser before closing ---
                 logger.debug("Attempting to disable laser as part of close sequence.")
@@ -492,7 +586,7 @@ class CT400(AbstractCT400):
             except Exception as e:
                 logger.warning(f"Could not disable laser during close sequence: {e}")
 
-            result = self.dll.CT400_Close(self.handle)
+            result = self._ct400_close(self.handle)
             if result == -1:
                 logger.warning(
                     f"Error code {result} received during CT400_Close. Resources may not be cleanly released."
@@ -500,10 +594,10 @@ class CT400(AbstractCT400):
             else:
                 logger.info("CT400 connection closed successfully.")
 
-        # Mark as closed regardless of outcome to prevent reuse
+        # Mark as closed regardless of outcome to prevent reuse. `self.handle` is the
+        # closed sentinel checked by `_check_open()`; `self.dll` is intentionally kept
+        # so late callers get a CT400CommunicationError instead of an AttributeError.
         self.handle = None
-        # Do not delete self.dll, just in case something calls after close.
-        # Python's garbage collector will handle it when the object is destroyed.
 
     def __enter__(self):
         """Allows the CT400 class to be used as a context manager."""
@@ -1,3 +1,4 @@
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -15,6 +16,27 @@ from logic.task_runner import BaseWorker
 logger = logging.getLogger("LabApp.CT400Init")
 
 
+@functools.lru_cache(maxsize=4)
+def _find_dll_cached(config_path: str, app_dir: str) -> Path | None:
+    """Probes the DLL search paths once per (config path, app dir) pair."""
+    # Define potential paths in order of priority
+    search_paths = [
+        config_path,  # 1. Path from config.ini
+        Path(app_dir) / "CT400_lib.dll",  # 2. Application root directory
+    ]
+
+    for p in search_paths:
+        if not p:  # Skip empty or None paths
+            continue
+        path_obj = Path(p)
+        if path_obj.exists():
+            logger.info(f"CT400InitWorker: Found CT400 DLL at: {path_obj}")
+            return path_obj
+
+    logger.warning("CT400InitWorker: No CT400 DLL found in search paths.")
+    return None
+
+
 class CT400InitWorker(BaseWorker):
     """
     A worker that initializes the CT400 in a separate thread.
@@ -37,23 +59,12 @@ class CT400InitWorker(BaseWorker):
         """Finds the CT400 DLL based on config, env vars, and app path."""
         # Determine the application's root directory
         app_dir = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path.cwd()
-
-        # Define potential paths in order of priority
-        search_paths = [
-            self.config.instruments.ct400_dll_path,  # 1. Path from config.ini
-            app_dir / "CT400_lib.dll",  # 2. Application root directory
-        ]
-
-        for p in search_paths:
-            if not p:  # Skip empty or None paths
-                continue
-            path_obj = Path(p)
-            if path_obj.exists():
-                logger.info(f"CT400InitWorker: Found CT400 DLL at: {path_obj}")
-                return path_obj
-
-        logger.warning("CT400InitWorker: No CT400 DLL found in search paths.")
-        return None
+        config_path = self.config.instruments.ct400_dll_path
+        dll_path = _find_dll_cached(str(config_path) if config_path else "", str(app_dir))
+        if dll_path is None:
+            # Don't remember misses, so a DLL installed later is found on the next attempt.
+            _find_dll_cached.cache_clear()
+        return dll_path
 
     @Slot()
     def run(self):
@@ -76,9 +87,22 @@ class CT400InitWorker(BaseWorker):
             return
 
         try:
+            # Stage 1: load and configure the DLL (cached, so instant on retries).
+            self.status_updated.emit("UNKNOWN", "CT400: Loading DLL...")
+            CT400.load_dll(dll_path_obj)
+            if not self._is_running:
+                logger.info("CT400InitWorker: Cancelled after loading the DLL.")
+                self.finished.emit()
+                return
+
+            # Stage 2: the slow, blocking CT400_Init handshake.
             self.status_updated.emit("UNKNOWN", "CT400: Initializing hardware...")
-            # This is the slow, blocking call
             ct400_device = CT400(dll_path_obj)
+            if not self._is_running:
+                logger.info("CT400InitWorker: Cancelled during initialization. Closing device.")
+                ct400_device.close()
+                self.finished.emit()
+                return
             logger.info(f"CT400InitWorker: CT400 device object created using DLL: {dll_path_obj}")
             self.status_updated.emit("DISCONNECTED", "CT400: Ready (Disconnected)")
             self.ct400_initialized.emit(ct400_device)
@@ -35,6 +35,10 @@ class Detector(IntEnum):
     DE_5 = 5
 
 
+# The four detectors read by `CT400_ReadPowerDetectors`, in the DLL's output order.
+POWER_ARRAY_DETECTORS = (Detector.DE_1, Detector.DE_2, Detector.DE_3, Detector.DE_4)
+
+
 class Enable(IntEnum):
     DISABLE = 0
     ENABLE = 1
@@ -45,7 +49,7 @@ class Unit(IntEnum):
     Unit_dBm = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PowerData:
     """Represents an instantaneous power reading from all CT400 detectors."""
 
@@ -77,7 +81,7 @@ class CT400StatusCode(IntEnum):
     UNKNOWN_ERROR = -100  # For any other error
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstrumentError:
     """
     A structured object to represent an error from an instrument.
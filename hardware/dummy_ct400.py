@@ -1,9 +1,10 @@
 import logging
+import threading
 import time
 
 import numpy as np
 
-from hardware.ct400_types import Detector, Enable, PowerData
+from hardware.ct400_types import POWER_ARRAY_DETECTORS, Detector, Enable, LaserInput, PowerData
 from hardware.interfaces import AbstractCT400
 
 logger = logging.getLogger("LabApp.DummyCT400")
@@ -12,6 +13,17 @@ logger = logging.getLogger("LabApp.DummyCT400")
 class DummyCT400(AbstractCT400):
     """A dummy implementation of the CT400 interface for testing and UI development."""
 
+    _MAX_WAIT_S = 0.25  # Longest single block in scan_wait_end
+
+    # Fake scan: a fixed wavelength axis with a simple Gaussian peak (center 1555 nm, width 1.5 nm).
+    _WAVELENGTHS = np.linspace(1550, 1560, 1001)
+    _PEAK_ENVELOPE = -10 * np.exp(-((_WAVELENGTHS - 1555) ** 2) / (2 * 1.5**2)) - 30
+    _WAVELENGTHS.setflags(write=False)  # Shared with every caller
+
+    # Fake live powers, ordered [pout, DE_1, DE_2, DE_3, DE_4].
+    _POWER_MEANS = np.array([-20.0, -35.0, -45.0, -80.0, -40.0])
+    _POWER_SPREAD = np.array([1.0, 2.0, 2.0, 0.0, 2.0])
+
     def __init__(self):
         logger.warning("=" * 50)
         logger.warning("CT400 HARDWARE NOT FOUND/CONFIGURED. USING DUMMY IMPLEMENTATION.")
@@ -21,9 +33,13 @@ class DummyCT400(AbstractCT400):
         self._is_scanning = False
         self._scan_start_time = 0
         self._scan_duration = 5.0  # Simulate a 5-second scan
+        # Set when the simulated scan ends or is stopped; scan_wait_end blocks on it.
+        self._scan_done = threading.Event()
+        self._rng = np.random.default_rng()
+        self._power_buf = np.empty(5)
 
     def is_connected(self) -> bool:
-        logger.debug(f"Dummy is_connected called. Returning: {self._is_connected}")
+        logger.debug("Dummy is_connected called. Returning: %s", self._is_connected)
         return self._is_connected
 
     def set_laser(self, *args, **kwargs) -> None:
@@ -31,13 +47,11 @@ class DummyCT400(AbstractCT400):
         # In a dummy, we can consider 'set_laser' as connecting.
         self._is_connected = True
 
-    def cmd_laser(self, *args, **kwargs) -> None:
-        logger.info("Dummy cmd_laser called with args: %s, kwargs: %s", args, kwargs)
-        # Check if the command is to disable the laser
-        # This is a simplified check. A more robust dummy would parse kwargs more carefully.
-        if "enable" in kwargs and kwargs["enable"] == Enable.DISABLE:
-            self._is_connected = False
-        elif len(args) > 1 and args[1] == Enable.DISABLE:
+    def cmd_laser(self, laser_input: LaserInput, enable: Enable, wavelength: float, power: float) -> None:
+        # Called for every laser step, so this stays at DEBUG level.
+        logger.debug("Dummy cmd_laser called: input=%s, enable=%s, WL=%s, P=%s", laser_input, enable, wavelength, power)
+        # Disabling the laser is treated as disconnecting.
+        if enable == Enable.DISABLE:
             self._is_connected = False
 
     def set_sampling_res(self, *args, **kwargs) -> None:
@@ -53,49 +67,54 @@ class DummyCT400(AbstractCT400):
         logger.info("Dummy start_scan called. Simulating a scan start.")
         self._is_scanning = True
         self._scan_start_time = time.monotonic()
+        self._scan_done.clear()
 
     def stop_scan(self) -> None:
         logger.info("Dummy stop_scan called.")
         self._is_scanning = False
+        self._scan_done.set()
 
     def scan_wait_end(self) -> tuple[int, str]:
-        """Dummy implementation, returns status code and an empty error string."""
+        """
+        Dummy implementation, returns status code and an empty error string.
+        Instead of returning "running" immediately, this blocks until the simulated
+        scan ends (or is stopped), capped at `_MAX_WAIT_S` so callers stay cancellable.
+        """
         if not self._is_scanning:
             return 0, ""  # Not scanning or already finished
 
-        elapsed = time.monotonic() - self._scan_start_time
-        if elapsed >= self._scan_duration:
+        remaining = self._scan_duration - (time.monotonic() - self._scan_start_time)
+        if remaining > 0:
+            self._scan_done.wait(min(remaining, self._MAX_WAIT_S))
+            remaining = self._scan_duration - (time.monotonic() - self._scan_start_time)
+        if remaining <= 0 or not self._is_scanning:
             logger.info("Dummy scan_wait_end: Scan finished.")
             self._is_scanning = False
             return 0, ""  # 0 means scan completed successfully
-        else:
-            return 1, ""  # 1 means scan is still running
+        return 1, ""  # 1 means scan is still running
 
     def get_data_points(self, dets_used: list[Detector]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns a fake scan. Both arrays are read-only: the wavelength axis is shared
+        between calls and the powers are a broadcast view, so callers must copy to modify.
+        """
         logger.info("Dummy get_data_points called. Generating fake data.")
-        # Generate some plausible fake data
-        wavelengths = np.linspace(1550, 1560, 1001)
-        # A simple Gaussian peak
-        peak_center = 1555
-        peak_width = 1.5
-        noise = np.random.randn(len(wavelengths)) * 0.1
-        powers = -10 * np.exp(-((wavelengths - peak_center) ** 2) / (2 * peak_width**2)) - 30 + noise
-
-        # Return in the same format as the real function
-        num_detectors = len(dets_used)
-        power_array = np.tile(powers, (num_detectors, 1))
-        return wavelengths, power_array
+        # Only the noise changes per call; the axis and the Gaussian peak are precomputed.
+        powers = self._rng.standard_normal(self._WAVELENGTHS.size)
+        powers *= 0.1
+        powers += self._PEAK_ENVELOPE
+
+        # Return in the same format as the real function (a read-only view, one row per detector)
+        return self._WAVELENGTHS, np.broadcast_to(powers, (len(dets_used), powers.size))
 
     def get_all_powers(self) -> PowerData:
-        # Return some random-ish but plausible live data
-        pout = -20 + np.random.randn()
-        detectors = {
-            Detector.DE_1: -35 + np.random.randn() * 2,
-            Detector.DE_2: -45 + np.random.randn() * 2,
-            Detector.DE_3: -80.0,  # Simulate a dead channel
-            Detector.DE_4: -40 + np.random.randn() * 2,
-        }
-        return PowerData(pout=pout, detectors=detectors)
+        # Return some random-ish but plausible live data: [pout, DE_1..DE_4], DE_3 simulates a dead channel.
+        buf = self._power_buf
+        self._rng.standard_normal(out=buf)
+        buf *= self._POWER_SPREAD
+        buf += self._POWER_MEANS
+        pout, *detector_powers = buf.tolist()
+        return PowerData(pout=pout, detectors=dict(zip(POWER_ARRAY_DETECTORS, detector_powers)))
 
     def close(self) -> None:
         logger.info("Dummy CT400 close called.")
@@ -1,14 +1,21 @@
 # hardware/piezo.py (Version 5 - With Prerequisite Call)
 
+import functools
 import logging
-from ctypes import POINTER, WinDLL, byref, c_char_p, c_double, c_int, create_string_buffer
+import threading
+from collections.abc import Callable
+from ctypes import POINTER, WinDLL, byref, c_char_p, c_double, c_int, create_string_buffer, memset
 from pathlib import Path
 
-# Note: We don't actually need pyserial for this attempt, but it's good to have.
-import serial.tools.list_ports
+import numpy as np
 
 logger = logging.getLogger("LabApp.Piezo")
 
+# Output buffer for the DLL's List function, shared by all device scans.
+_LIST_BUF = create_string_buffer(10240)
+# The driver is not documented as thread-safe, so List, Open and Close are never called concurrently.
+_DLL_LOCK = threading.Lock()
+
 
 # ... Exceptions are the same ...
 class PiezoError(Exception): ...
@@ -20,22 +27,38 @@ class PiezoConnectionError(PiezoError): ...
 class PiezoController:
     _dll = None
     VOLTS_PER_NM = 0.0037
+    _AXIS_FUNC_NAMES = (("Get", "Voltage"), ("Set", "Voltage"), ("Get", "MinVoltage"), ("Get", "MaxVoltage"))
 
     def __init__(self, dll_path: Path):
+        self._ensure_dll(dll_path)
+        self._id_buf = create_string_buffer(256)  # Reused by get_id
+
+        self.hdl: int | None = None
+        self.port: str | None = None
+        # Per-axis (GetVoltage, SetVoltage, GetMinVoltage, GetMaxVoltage) functions, resolved once.
+        dll = PiezoController._dll
+        self._axis_funcs = {
+            axis: tuple(getattr(dll, f"{op}{axis.upper()}Axis{kind}") for op, kind in self._AXIS_FUNC_NAMES)
+            for axis in ("x", "y", "z")
+        }
+        # Per-axis (min, max) voltage, queried once per connection.
+        self._voltage_limits: dict[str, tuple[float, float]] = {}
+
+    @classmethod
+    def _ensure_dll(cls, dll_path: Path) -> None:
+        """Loads and configures the shared Piezo DLL on first use."""
         if PiezoController._dll is None:
             if not dll_path.is_file():
                 raise FileNotFoundError(f"Piezo DLL not found at: {dll_path}")
             try:
                 PiezoController._dll = WinDLL(str(dll_path))
-                self._configure_func_signatures()
+                cls._configure_func_signatures()
             except OSError as e:
                 PiezoController._dll = None
                 raise PiezoError(f"Failed to load Piezo DLL from {dll_path}: {e}") from e
 
-        self.hdl: int | None = None
-        self.port: str | None = None
-
-    def _configure_func_signatures(self):
+    @staticmethod
+    def _configure_func_signatures():
         if not hasattr(PiezoController._dll, "signatures_configured"):
             dll = PiezoController._dll
             # --- CRITICAL ADDITION: List function ---
@@ -76,13 +99,19 @@ class PiezoController:
             dll.SetZAxisVoltage.restype = c_int
             dll.signatures_configured = True
 
+    def _funcs(self, axis: str) -> tuple:
+        """Returns the cached (get, set, get_min, get_max) DLL functions for an axis."""
+        try:
+            return self._axis_funcs[axis]
+        except KeyError:
+            raise PiezoError(f"Unknown axis '{axis}'. Expected 'x', 'y' or 'z'.") from None
+
     def get_max_voltage(self, axis: str) -> float:
         """Gets the maximum voltage for a specific axis ('x', 'y', or 'z')."""
         if not self.is_connected():
             raise PiezoConnectionError("Not connected")
         voltage = c_double(0)
-        func = getattr(self._dll, f"Get{axis.capitalize()}AxisMaxVoltage")
-        rc = func(self.hdl, byref(voltage))
+        rc = self._funcs(axis)[3](self.hdl, byref(voltage))
         if rc < 0:
             raise PiezoError(f"GetMaxVoltage failed for axis {axis} with code {rc}")
         return voltage.value
@@ -92,49 +121,76 @@ class PiezoController:
         if not self.is_connected():
             raise PiezoConnectionError("Not connected")
         voltage = c_double(0)
-        func = getattr(self._dll, f"Get{axis.capitalize()}AxisMinVoltage")
-        rc = func(self.hdl, byref(voltage))
+        rc = self._funcs(axis)[2](self.hdl, byref(voltage))
         if rc < 0:
             raise PiezoError(f"GetMinVoltage failed for axis {axis} with code {rc}")
         return voltage.value
 
+    def get_voltage_limits(self, axis: str) -> tuple[float, float]:
+        """Returns the (min, max) voltage of an axis, queried from the device once per connection."""
+        limits = self._voltage_limits.get(axis)
+        if limits is None:
+            limits = self._voltage_limits[axis] = (self.get_min_voltage(axis), self.get_max_voltage(axis))
+        return limits
+
     @staticmethod
     def find_devices(dll_path: Path) -> list[str]:
         """
         Finds valid Thorlabs Piezo controllers by first calling the List
         function to prime the DLL, then attempting to open discovered COM ports.
+        The (multi-second) scan runs once per DLL path; call
+        `PiezoController.clear_device_cache()` to force a rescan.
         """
         if not dll_path.is_file():
             logger.error(f"Cannot find devices; DLL not found at {dll_path}")
             return []
+        found = PiezoController._scan_devices(dll_path.resolve())
+        if not found:
+            # Don't remember empty scans: the controllers may simply be switched off.
+            PiezoController._scan_devices.cache_clear()
+        return list(found)
 
-        if PiezoController._dll is None:
-            PiezoController(dll_path)
+    @staticmethod
+    def clear_device_cache() -> None:
+        """Forgets cached `find_devices` results so the next call rescans the COM ports."""
+        PiezoController._scan_devices.cache_clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _scan_devices(dll_path: Path) -> tuple[str, ...]:
+        """Performs the COM-port scan behind `find_devices`; memoized per DLL path."""
+        # pyserial is only needed for discovery, so it is imported here rather than at module load.
+        import serial.tools.list_ports
+
+        PiezoController._ensure_dll(dll_path)
 
         # --- NEW STRATEGY ---
         # 1. Call the DLL's List function. This may be a necessary prerequisite
         #    to initialize the driver's internal state.
         logger.info("Calling DLL's List function to prime the driver...")
-        list_buffer = create_string_buffer(10240)
-        num_devices_from_list = PiezoController._dll.List(list_buffer, 10240)
-        logger.info(
-            f"DLL List function returned {num_devices_from_list} devices with raw string: {list_buffer.value.decode(errors='ignore')}"
-        )
+        with _DLL_LOCK:
+            memset(_LIST_BUF, 0, len(_LIST_BUF))
+            num_devices_from_list = PiezoController._dll.List(_LIST_BUF, len(_LIST_BUF))
+            raw_list = _LIST_BUF.value.decode(errors="ignore")
+        logger.info(f"DLL List function returned {num_devices_from_list} devices with raw string: {raw_list}")
 
         # 2. Now, proceed with our robust scanning of all available system COM ports.
         available_ports = [port.device for port in serial.tools.list_ports.comports()]
         logger.info(f"Scanning available system COM ports: {available_ports}")
 
+        # Each probe can block for the full open timeout; probes share the DLL lock, so they run one at a time.
         found_devices = []
         for port in available_ports:
-            # Short timeout for the scan
-            hdl = PiezoController._dll.Open(port.encode("utf-8"), 115200, 1)
+            with _DLL_LOCK:
+                # Short timeout for the scan
+                hdl = PiezoController._dll.Open(port.encode("utf-8"), 115200, 1)
+                if hdl >= 0:
+                    PiezoController._dll.Close(hdl)
             if hdl >= 0:
                 logger.info(f"Successfully opened device on {port} with handle {hdl}. This is a Piezo Controller.")
                 found_devices.append(port)
-                PiezoController._dll.Close(hdl)
             else:
-                logger.debug(f"Port {port} is not a Piezo Controller. Open failed with code {hdl}.")
+                logger.debug("Port %s is not a Piezo Controller. Open failed with code %s.", port, hdl)
 
         if not found_devices:
             logger.warning(
@@ -143,15 +199,17 @@ class PiezoController:
         else:
             logger.info(f"Confirmed Piezo controllers on ports: {found_devices}")
 
-        return found_devices
+        return tuple(found_devices)
 
     # The rest of the PiezoController class (connect, disconnect, get_voltage, etc.)
     # remains exactly the same as in Version 4.
     def connect(self, port: str, baud_rate: int = 115200, timeout: int = 3) -> None:
         if self.is_connected():
             self.disconnect()
+        self._voltage_limits.clear()
         self.port = port
-        self.hdl = self._dll.Open(port.encode("utf-8"), baud_rate, timeout)
+        with _DLL_LOCK:
+            self.hdl = self._dll.Open(port.encode("utf-8"), baud_rate, timeout)
         if self.hdl < 0:
             error_code = self.hdl
             self.hdl = None
@@ -163,9 +221,11 @@ class PiezoController:
     def disconnect(self) -> None:
         if self.hdl is not None:
             logger.info(f"Disconnecting from Piezo on port {self.port}...")
-            self._dll.Close(self.hdl)
+            with _DLL_LOCK:
+                self._dll.Close(self.hdl)
         self.hdl = None
         self.port = None
+        self._voltage_limits.clear()
 
     def is_connected(self) -> bool:
         return self.hdl is not None
@@ -173,7 +233,8 @@ class PiezoController:
     def get_id(self) -> str:
         if not self.is_connected():
             raise PiezoConnectionError("Device not connected.")
-        buffer = create_string_buffer(256)
+        buffer = self._id_buf
+        memset(buffer, 0, len(buffer))
         rc = self._dll.GetId(self.hdl, buffer)
         if rc < 0:
             raise PiezoError(f"GetId failed with code {rc}")
@@ -183,8 +244,7 @@ class PiezoController:
         if not self.is_connected():
             raise PiezoConnectionError("Not connected")
         voltage = c_double(0)
-        func = getattr(self._dll, f"Get{axis.capitalize()}AxisVoltage")
-        rc = func(self.hdl, byref(voltage))
+        rc = self._funcs(axis)[0](self.hdl, byref(voltage))
         if rc < 0:
             raise PiezoError(f"GetVoltage failed for axis {axis} with code {rc}")
         return voltage.value
@@ -194,21 +254,51 @@ class PiezoController:
             raise PiezoConnectionError("Not connected")
 
         # --- NEW: Add robust voltage clamping ---
-        min_v = self.get_min_voltage(axis)
-        max_v = self.get_max_voltage(axis)
-        clamped_voltage = max(min_v, min(max_v, voltage))
-
-        if abs(clamped_voltage - voltage) > 1e-9:  # Use a small tolerance for float comparison
+        min_v, max_v = self.get_voltage_limits(axis)
+        if min_v <= voltage <= max_v:
+            clamped_voltage = voltage  # Fast path: in range, nothing to report
+        else:
+            clamped_voltage = min_v if voltage < min_v else max_v
             logger.warning(
                 f"Voltage for axis {axis} out of range. Commanded: {voltage:.3f}V, Clamped to: {clamped_voltage:.3f}V"
             )
         # ----------------------------------------
 
-        func = getattr(self._dll, f"Set{axis.capitalize()}AxisVoltage")
-        rc = func(self.hdl, c_double(clamped_voltage))  # Use the clamped value
+        rc = self._funcs(axis)[1](self.hdl, c_double(clamped_voltage))  # Use the clamped value
         if rc < 0:
             raise PiezoError(f"SetVoltage failed for axis {axis} with code {rc}")
 
+    def set_voltage_sequence(
+        self, axis: str, voltages: np.ndarray, on_step: Callable[[int, float], None] | None = None
+    ) -> None:
+        """
+        Steps an axis through a sequence of voltages, e.g. one line of a raster scan.
+        The whole sequence is clamped in one NumPy pass and the DLL function is
+        resolved once; the DLL has no array entry point, so each point is still one call.
+        Args:
+            axis: 'x', 'y' or 'z'.
+            voltages: Target voltages, applied in order.
+            on_step: Optional callback invoked with (index, applied_voltage) after each set,
+                     e.g. to settle and take a reading.
+        """
+        if not self.is_connected():
+            raise PiezoConnectionError("Not connected")
+        min_v, max_v = self.get_voltage_limits(axis)
+        targets = np.asarray(voltages, dtype=np.float64)
+        clamped = np.clip(targets, min_v, max_v)
+        if not np.array_equal(clamped, targets):
+            logger.warning(
+                f"Voltage sequence for axis {axis} exceeds [{min_v:.3f}, {max_v:.3f}]V; out-of-range points clamped."
+            )
+        set_func = self._funcs(axis)[1]
+        hdl = self.hdl
+        for i, voltage in enumerate(clamped.tolist()):
+            rc = set_func(hdl, voltage)
+            if rc < 0:
+                raise PiezoError(f"SetVoltage failed for axis {axis} at step {i} with code {rc}")
+            if on_step is not None:
+                on_step(i, voltage)
+
     def move_nm(self, axis: str, distance_nm: float) -> None:
         current_voltage = self.get_voltage(axis)
         voltage_delta = distance_nm * self.VOLTS_PER_NM
@@ -38,6 +38,7 @@ class PiezoInitWorker(BaseWorker):
             if not dll_path.is_file():
                 raise PiezoError(f"Piezo DLL not found at specified path: {dll_path}")
 
+            # Cached per DLL path, so re-running the worker doesn't rescan every COM port.
             found_ports = PiezoController.find_devices(dll_path)
             logger.info(f"Piezo worker discovered devices: {found_ports}")
 
@@ -68,18 +69,6 @@ class PiezoInitWorker(BaseWorker):
             logger.exception(f"Unexpected error in piezo init worker: {e}")
             self.initialization_failed.emit(f"An unexpected error occurred: {e}")
 
-        except (PiezoError, FileNotFoundError) as e:
-            logger.error(f"Failed to initialize Piezo controllers: {e}", exc_info=True)
-            self.initialization_failed.emit(str(e))
-            # Ensure partial connections are cleaned up
-            if piezo_left and piezo_left.is_connected():
-                piezo_left.disconnect()
-            if piezo_right and piezo_right.is_connected():
-                piezo_right.disconnect()
-        except Exception as e:
-            logger.exception(f"Unexpected error in piezo init worker: {e}")
-            self.initialization_failed.emit(f"An unexpected error occurred: {e}")
-
         self.finished.emit()
 
     def stop(self):
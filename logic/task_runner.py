@@ -1,6 +1,6 @@
 import logging
 
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+from PySide6.QtCore import QMetaObject, QObject, QRunnable, Qt, QThread, QThreadPool, Signal, Slot
 
 logger = logging.getLogger("LabApp.TaskRunner")
 
@@ -26,24 +26,60 @@ class BaseWorker(QObject):
         pass
 
 
+class _PooledWorkerRunnable(QRunnable):
+    """Runs a one-shot worker's run() on a QThreadPool thread."""
+
+    def __init__(self, runner: "TaskRunner"):
+        super().__init__()
+        self.runner = runner
+
+    def run(self):
+        worker = self.runner.worker
+        try:
+            worker.run()
+        finally:
+            self.runner._pool_running = False
+            # The worker lives in the thread that created it; delete it there.
+            QMetaObject.invokeMethod(worker, "deleteLater", Qt.ConnectionType.QueuedConnection)
+
+
 class TaskRunner(QObject):
     """
     Manages the lifecycle of a QThread and a Worker.
     Handles the boilerplate of moveToThread, starting, and cleaning up.
+    Short one-shot tasks can instead run on the shared QThreadPool (`use_pool=True`),
+    which avoids creating and tearing down a dedicated thread and event loop.
     """
 
     # Signal to re-emit errors from the worker to the main thread convenience
     error_occurred = Signal(str)
 
-    def __init__(self, worker: BaseWorker, auto_start_run: bool = True):
+    def __init__(self, worker: BaseWorker, auto_start_run: bool = True, use_pool: bool = False):
         """
         Args:
             worker: An instance of a class inheriting from BaseWorker.
             auto_start_run: If True, thread.started is connected to worker.run.
                             Set False for 'Service' workers (like Alignment) that wait for signals.
+            use_pool: If True, run the worker once on QThreadPool.globalInstance() instead of
+                      a dedicated QThread. Only for one-shot workers; `thread` is then None.
+                      The worker stays in the creating thread, so its signals reach
+                      UI-thread receivers as queued connections.
         """
         super().__init__()
         self.worker = worker
+        self.thread: QThread | None = None
+        self._runnable: _PooledWorkerRunnable | None = None
+        self._pool_running = False
+
+        # Error Forwarding (Optional, but useful)
+        self.worker.error.connect(self.error_occurred)
+
+        if use_pool:
+            if not auto_start_run:
+                raise ValueError("Pooled tasks must be one-shot (auto_start_run=True).")
+            self._runnable = _PooledWorkerRunnable(self)
+            return
+
         self.thread = QThread()
 
         # 1. Move the worker to the new thread
@@ -61,19 +97,31 @@ class TaskRunner(QObject):
         self.thread.finished.connect(self.worker.deleteLater)
         self.thread.finished.connect(self.thread.deleteLater)
 
-        # 3. Error Forwarding (Optional, but useful)
-        self.worker.error.connect(self.error_occurred)
-
     def start(self):
-        """Starts the background thread."""
+        """Starts the background thread (or queues the worker on the thread pool)."""
         logger.debug(f"Starting thread for worker: {self.worker.__class__.__name__}")
+        if self._runnable is not None:
+            self._pool_running = True
+            QThreadPool.globalInstance().start(self._runnable)
+            return
         self.thread.start()
 
+    def is_running(self) -> bool:
+        """Returns True while the worker's thread (or pooled run) is active."""
+        if self._runnable is not None:
+            return self._pool_running
+        return self.thread.isRunning()
+
     def stop(self):
         """
         Forcefully asks the thread to stop.
         Note: The worker usually needs its own 'stop()' method to break loops safely.
+        Pooled runs cannot be interrupted from outside; only the worker's own stop() applies.
         """
+        if self._runnable is not None:
+            if self._pool_running and hasattr(self.worker, "stop"):
+                self.worker.stop()
+            return
         if self.thread.isRunning():
             self.thread.quit()
             self.thread.wait()
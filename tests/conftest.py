@@ -0,0 +1,14 @@
+import ctypes
+import sys
+
+if sys.platform != "win32":
+    # The hardware wrappers import ctypes.WinDLL at module level. Off Windows the tests
+    # drive them through fake libraries, so any loader class will do for the import.
+    # The alias is removed again so other libraries (colorama, via pyqtgraph) don't
+    # mistake the platform for Windows.
+    ctypes.WinDLL = ctypes.CDLL
+    try:
+        import hardware.ct400  # noqa: F401
+        import hardware.piezo  # noqa: F401
+    finally:
+        del ctypes.WinDLL
@@ -0,0 +1,190 @@
+import numpy as np
+import pytest
+
+from hardware.camera import CameraSettings, FrameBuffer, FramePool, VimbaCam
+
+
+class FakeFeature:
+    def __init__(self, device, name, value):
+        self._device = device
+        self._name = name
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        self._device.writes.append((self._name, value))
+
+    def get_range(self):
+        self._device.range_queries.append(self._name)
+        return self._device.range_of(self._name)
+
+    def is_readable(self):
+        return True
+
+    def is_writeable(self):
+        return True
+
+
+class FakeDevice:
+    """A camera whose exposure limit follows the frame rate, as on GenICam devices."""
+
+    def __init__(self):
+        self.writes: list[tuple[str, object]] = []
+        self.range_queries: list[str] = []
+        self.features = {
+            name: FakeFeature(self, name, value)
+            for name, value in (
+                ("ExposureTimeAbs", 10000.0),
+                ("AcquisitionFrameRateAbs", 10.0),
+                ("Gain", 0.0),
+                ("Gamma", 1.0),
+                ("ExposureAuto", "Off"),
+                ("GainAuto", "Off"),
+            )
+        }
+
+    def get_feature_by_name(self, name):
+        return self.features[name]
+
+    def range_of(self, name):
+        if name == "ExposureTimeAbs":
+            return 10.0, 1e6 / self.features["AcquisitionFrameRateAbs"].value
+        return {"AcquisitionFrameRateAbs": (1.0, 100.0), "Gain": (0.0, 24.0), "Gamma": (0.25, 4.0)}[name]
+
+
+@pytest.fixture
+def camera(qapp):
+    cam = VimbaCam("DEV_TEST")
+    cam.device = FakeDevice()
+    return cam
+
+
+def test_feature_range_is_queried_once(camera):
+    assert camera.get_feature_range("Gain") == (0.0, 24.0)
+    assert camera.get_feature_range("Gain") == (0.0, 24.0)
+
+    assert camera.device.range_queries == ["Gain"]
+
+
+def test_writing_a_range_input_drops_cached_ranges(camera):
+    assert camera.get_feature_range("ExposureTimeAbs") == (10.0, 100000.0)
+
+    camera._write_feature("AcquisitionFrameRateAbs", 50.0)
+
+    assert camera.get_feature_range("ExposureTimeAbs") == (10.0, 20000.0)
+
+
+def test_writing_other_features_keeps_cached_ranges(camera):
+    camera.get_feature_range("ExposureTimeAbs")
+
+    assert camera.set_gamma(2.0)
+    camera.get_feature_range("ExposureTimeAbs")
+
+    assert camera.device.range_queries.count("ExposureTimeAbs") == 1
+
+
+def test_set_exposure_clamps_to_the_current_range(camera):
+    camera.get_feature_range("ExposureTimeAbs")
+    camera._write_feature("AcquisitionFrameRateAbs", 100.0)
+
+    assert camera.set_exposure(50000.0)
+
+    assert camera.device.features["ExposureTimeAbs"].value == 10000.0
+    assert camera.exposure_us == 10000.0
+
+
+def test_apply_settings_clamps_each_value_and_disables_auto_modes(camera):
+    camera.device.features["ExposureAuto"].value = "Continuous"
+
+    assert camera.apply_settings(CameraSettings(exposure_us=5.0, gain_db=30.0, gamma=1.5))
+
+    features = camera.device.features
+    assert features["ExposureAuto"].value == "Off"
+    assert features["GainAuto"].value == "Off"
+    assert (features["ExposureTimeAbs"].value, features["Gain"].value, features["Gamma"].value) == (10.0, 24.0, 1.5)
+    assert (camera.exposure_us, camera.gain_db, camera.gamma) == (10.0, 24.0, 1.5)
+    assert not camera.is_auto_exposure_on
+    assert not camera.is_auto_gain_on
+
+
+def test_apply_settings_without_device_fails(camera):
+    camera.device = None
+
+    assert not camera.apply_settings(CameraSettings())
+
+
+SHAPE = (4, 6)
+DTYPE = np.dtype(np.uint8)
+
+
+def test_frame_pool_reuses_released_arrays():
+    pool = FramePool(size=2)
+    first = pool.acquire(SHAPE, DTYPE)
+    pool.release(first)
+
+    assert pool.acquire(SHAPE, DTYPE) is first
+
+
+def test_frame_pool_never_hands_out_a_held_array():
+    pool = FramePool(size=2)
+    first = pool.acquire(SHAPE, DTYPE, holders=2)
+    pool.release(first)
+
+    second = pool.acquire(SHAPE, DTYPE)
+    third = pool.acquire(SHAPE, DTYPE)
+
+    assert second is not first
+    assert third is not first and third is not second
+
+
+def test_frame_pool_matches_shape_and_dtype():
+    pool = FramePool(size=2)
+    mono = pool.acquire(SHAPE, DTYPE)
+    pool.release(mono)
+
+    color = pool.acquire((*SHAPE, 3), DTYPE)
+
+    assert color is not mono
+    assert color.shape == (*SHAPE, 3)
+
+
+def test_frame_pool_ignores_releases_of_replaced_arrays():
+    pool = FramePool(size=1)
+    old = pool.acquire(SHAPE, DTYPE)
+    new = pool.acquire(SHAPE, DTYPE, holders=2)  # The only slot is held, so `old` is replaced
+    pool.release(old)
+    pool.release(new)
+
+    # `new` still has one holder: the late release of `old` must not have counted against it.
+    assert pool.acquire(SHAPE, DTYPE) is not new
+
+
+def test_frame_buffer_returns_discarded_frames():
+    discarded = []
+    buffer = FrameBuffer(on_discard=discarded.append)
+    frames = [np.full(SHAPE, i, dtype=DTYPE) for i in range(4)]
+
+    for frame in frames:
+        buffer.add_frame(frame)
+
+    assert [frame[0, 0] for frame in discarded] == [0, 1]
+    assert buffer.get_latest_frame()[0, 0] == 3
+
+
+def test_attached_consumer_holds_frames_until_released(qapp):
+    cam = VimbaCam("DEV_TEST")
+    received = []
+    cam.attach_frame_consumer(received.append)
+
+    frame = cam._frame_pool.acquire(SHAPE, DTYPE, holders=1 + len(cam._frame_consumers))
+    cam.new_frame.emit(frame)
+    cam.release_frame(frame)  # The frame buffer's hold
+
+    assert received[0] is frame
+    assert cam._frame_pool.acquire(SHAPE, DTYPE) is not frame
+    cam.release_frame(received[0])
+    cam.detach_frame_consumer(received.append)
+    assert cam._frame_consumers == []
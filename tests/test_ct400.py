@@ -0,0 +1,180 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from hardware.ct400 import CT400, CT400CommunicationError
+from hardware.ct400_types import Detector
+
+
+class FakeCT400DLL:
+    """Stands in for CT400_lib.dll: implements the calls under test, every other export returns 0."""
+
+    def __init__(self):
+        # (pout, DE_1, DE_2, DE_3, DE_4, vext), as written by CT400_ReadPowerDetectors.
+        self.powers = (-1.5, -10.0, -20.0, -30.0, -40.0, 0.0)
+        # Per-thread readings; when set, each calling thread gets its own values, written slowly.
+        self.powers_by_thread: dict[int, tuple[float, ...]] | None = None
+        # (return code, message) for CT400_ScanWaitEnd.
+        self.scan_result = (0, b"")
+        # Resampled scan data: wavelengths and the power trace of each detector.
+        self.scan_wavelengths: list[float] = []
+        self.scan_powers: dict[int, list[float]] = {}
+
+    def CT400_Init(self, error_ref):
+        return 1
+
+    def CT400_ReadPowerDetectors(self, handle, *refs):
+        if self.powers_by_thread is None:
+            values = self.powers
+        else:
+            values = self.powers_by_thread[threading.get_ident()]
+        for ref, value in zip(refs, values):
+            ref._obj.value = value
+            if self.powers_by_thread is not None:
+                time.sleep(0)  # Let other readers run between writes
+        return 0
+
+    def CT400_ScanWaitEnd(self, handle, error_buf):
+        code, message = self.scan_result
+        if message:
+            error_buf.value = message
+        return code
+
+    def CT400_GetNbDataPointsResampled(self, handle):
+        return len(self.scan_wavelengths)
+
+    def CT400_ScanGetWavelengthResampledArray(self, handle, out, count):
+        for i in range(count):
+            out[i] = self.scan_wavelengths[i]
+        return 0
+
+    def CT400_ScanGetDetectorResampledArray(self, handle, detector, out, count):
+        for i in range(count):
+            out[i] = self.scan_powers[detector][i]
+        return 0
+
+    def __getattr__(self, name):
+        if not name.startswith("CT400_"):
+            raise AttributeError(name)
+        return lambda *args: 0
+
+
+@pytest.fixture
+def fake_dll():
+    return FakeCT400DLL()
+
+
+@pytest.fixture
+def ct400(monkeypatch, fake_dll):
+    monkeypatch.setattr(CT400, "load_dll", classmethod(lambda cls, dll_path: fake_dll))
+    device = CT400(Path("CT400_lib.dll"))
+    yield device
+    device.close()
+
+
+def test_get_all_powers_maps_dll_outputs_to_detectors(ct400):
+    data = ct400.get_all_powers()
+
+    assert data.pout == -1.5
+    assert data.detectors == {
+        Detector.DE_1: -10.0,
+        Detector.DE_2: -20.0,
+        Detector.DE_3: -30.0,
+        Detector.DE_4: -40.0,
+    }
+
+
+def test_get_all_powers_returns_independent_readings(ct400, fake_dll):
+    first = ct400.get_all_powers()
+    fake_dll.powers = (-2.5, -11.0, -21.0, -31.0, -41.0, 0.0)
+    second = ct400.get_all_powers()
+
+    # The ctypes outputs are reused between reads; earlier results must not change with them.
+    assert first.pout == -1.5
+    assert first.detectors[Detector.DE_1] == -10.0
+    assert second.pout == -2.5
+    assert second.detectors[Detector.DE_4] == -41.0
+
+
+def test_get_all_powers_is_consistent_across_threads(ct400, fake_dll):
+    fake_dll.powers_by_thread = {}
+    lock = threading.Lock()
+
+    def read(offset):
+        with lock:
+            fake_dll.powers_by_thread[threading.get_ident()] = tuple(float(offset + i) for i in range(6))
+        readings = [ct400.get_all_powers() for _ in range(50)]
+        return offset, readings
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(read, (0, 100, 200, 300)))
+
+    for offset, readings in results:
+        for data in readings:
+            assert data.pout == offset
+            assert list(data.detectors.values()) == [offset + 1, offset + 2, offset + 3, offset + 4]
+
+
+@pytest.mark.parametrize("code, expected_message", [(0, ""), (1, "")])
+def test_scan_wait_end_status_without_error(ct400, fake_dll, code, expected_message):
+    fake_dll.scan_result = (code, b"")
+
+    assert ct400.scan_wait_end() == (code, expected_message)
+
+
+def test_scan_wait_end_decodes_device_error_message(ct400, fake_dll):
+    fake_dll.scan_result = (-2, b"No laser connected")
+
+    assert ct400.scan_wait_end() == (-2, "No laser connected")
+
+
+def test_scan_wait_end_falls_back_to_status_text(ct400, fake_dll):
+    fake_dll.scan_result = (-2, b"Stale message")
+    ct400.scan_wait_end()
+    fake_dll.scan_result = (-3, b"")
+
+    # The reused buffer is cleared before each call, so an old message never leaks into a new error.
+    assert ct400.scan_wait_end() == (-3, "Scan error: no detector")
+
+
+def test_scan_wait_end_raises_when_the_call_fails(ct400, fake_dll):
+    fake_dll.scan_result = (-1, b"USB timeout")
+
+    with pytest.raises(CT400CommunicationError, match="USB timeout"):
+        ct400.scan_wait_end()
+
+
+def test_get_data_points_returns_requested_detector_rows(ct400, fake_dll):
+    fake_dll.scan_wavelengths = [1550.0, 1550.5, 1551.0]
+    fake_dll.scan_powers = {Detector.DE_1: [-1.0, -2.0, -3.0], Detector.DE_3: [-7.0, -8.0, -9.0]}
+
+    wavelengths, powers = ct400.get_data_points([Detector.DE_3, Detector.DE_1])
+
+    np.testing.assert_array_equal(wavelengths, [1550.0, 1550.5, 1551.0])
+    np.testing.assert_array_equal(powers, [[-7.0, -8.0, -9.0], [-1.0, -2.0, -3.0]])
+
+
+def test_get_data_points_results_survive_the_next_scan(ct400, fake_dll):
+    fake_dll.scan_wavelengths = [1550.0, 1551.0]
+    fake_dll.scan_powers = {Detector.DE_1: [-1.0, -2.0]}
+    first_wl, first_pows = ct400.get_data_points([Detector.DE_1])
+    fake_dll.scan_wavelengths = [1560.0, 1561.0]
+    fake_dll.scan_powers = {Detector.DE_1: [-5.0, -6.0]}
+
+    second_wl, second_pows = ct400.get_data_points([Detector.DE_1])
+
+    np.testing.assert_array_equal(first_wl, [1550.0, 1551.0])
+    np.testing.assert_array_equal(first_pows, [[-1.0, -2.0]])
+    np.testing.assert_array_equal(second_wl, [1560.0, 1561.0])
+    np.testing.assert_array_equal(second_pows, [[-5.0, -6.0]])
+
+
+def test_get_data_points_without_data_returns_empty_arrays(ct400):
+    wavelengths, powers = ct400.get_data_points([Detector.DE_1, Detector.DE_2])
+
+    assert wavelengths.shape == (0,)
+    assert powers.shape == (2, 0)
@@ -0,0 +1,170 @@
+import threading
+import time
+from ctypes import c_char_p
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from hardware.piezo import PiezoConnectionError, PiezoController, PiezoError
+
+
+class FakePiezoDLL:
+    """Stands in for the Thorlabs piezo DLL: one controller with 0-75 V axes that records every set."""
+
+    def __init__(self):
+        self.controller_ports = {b"COM3"}
+        self.open_calls: list[bytes] = []
+        self.calls_in_flight = 0
+        self.max_calls_in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self.voltages = {"X": 0.0, "Y": 0.0, "Z": 0.0}
+        self.limits = (0.0, 75.0)
+        self.set_calls: list[tuple[str, float]] = []
+        self.fail_set_after: int | None = None  # Number of successful sets before SetVoltage fails
+
+    def List(self, buf, size):
+        return self._track(lambda: 0)
+
+    def Open(self, port: c_char_p, baud_rate, timeout):
+        self.open_calls.append(port)
+        return self._track(lambda: 7 if port in self.controller_ports else -1)
+
+    def Close(self, hdl):
+        return self._track(lambda: 0)
+
+    def _track(self, call):
+        with self._in_flight_lock:
+            self.calls_in_flight += 1
+            self.max_calls_in_flight = max(self.max_calls_in_flight, self.calls_in_flight)
+        time.sleep(0.01)  # Give concurrent callers a chance to overlap
+        try:
+            return call()
+        finally:
+            with self._in_flight_lock:
+                self.calls_in_flight -= 1
+
+    def __getattr__(self, name):
+        for axis in ("X", "Y", "Z"):
+            if name == f"Get{axis}AxisVoltage":
+                return lambda hdl, ref, axis=axis: self._write(ref, self.voltages[axis])
+            if name == f"Set{axis}AxisVoltage":
+                return lambda hdl, voltage, axis=axis: self._set(axis, voltage)
+            if name == f"Get{axis}AxisMinVoltage":
+                return lambda hdl, ref: self._write(ref, self.limits[0])
+            if name == f"Get{axis}AxisMaxVoltage":
+                return lambda hdl, ref: self._write(ref, self.limits[1])
+        raise AttributeError(name)
+
+    @staticmethod
+    def _write(ref, value):
+        ref._obj.value = value
+        return 0
+
+    def _set(self, axis, voltage):
+        if self.fail_set_after is not None and len(self.set_calls) >= self.fail_set_after:
+            return -4
+        self.set_calls.append((axis, voltage))
+        self.voltages[axis] = voltage
+        return 0
+
+
+@pytest.fixture
+def fake_dll(monkeypatch):
+    dll = FakePiezoDLL()
+    monkeypatch.setattr(PiezoController, "_dll", dll)
+    return dll
+
+
+@pytest.fixture
+def piezo(fake_dll):
+    controller = PiezoController(Path("Thorlabs.MDT69XB.dll"))
+    controller.connect("COM3")
+    yield controller
+    controller.disconnect()
+
+
+def test_set_voltage_sequence_applies_points_in_order(piezo, fake_dll):
+    steps = []
+
+    piezo.set_voltage_sequence("y", np.array([1.0, 2.5, 4.0]), on_step=lambda i, v: steps.append((i, v)))
+
+    assert fake_dll.set_calls == [("Y", 1.0), ("Y", 2.5), ("Y", 4.0)]
+    assert steps == [(0, 1.0), (1, 2.5), (2, 4.0)]
+
+
+def test_set_voltage_sequence_calls_back_after_each_set(piezo, fake_dll):
+    seen = []
+
+    piezo.set_voltage_sequence("x", [3.0, 6.0], on_step=lambda i, v: seen.append(fake_dll.voltages["X"]))
+
+    assert seen == [3.0, 6.0]
+
+
+def test_set_voltage_sequence_clamps_to_axis_limits(piezo, fake_dll):
+    piezo.set_voltage_sequence("z", [-5.0, 10.0, 80.0])
+
+    assert fake_dll.set_calls == [("Z", 0.0), ("Z", 10.0), ("Z", 75.0)]
+
+
+def test_set_voltage_sequence_reports_the_failing_step(piezo, fake_dll):
+    fake_dll.fail_set_after = 1
+
+    with pytest.raises(PiezoError, match="at step 1 with code -4"):
+        piezo.set_voltage_sequence("x", [1.0, 2.0, 3.0])
+    assert fake_dll.set_calls == [("X", 1.0)]
+
+
+def test_set_voltage_sequence_stops_when_the_callback_raises(piezo, fake_dll):
+    def stop_after_first(i, voltage):
+        raise InterruptedError("cancelled")
+
+    with pytest.raises(InterruptedError):
+        piezo.set_voltage_sequence("y", [1.0, 2.0], on_step=stop_after_first)
+    assert fake_dll.set_calls == [("Y", 1.0)]
+
+
+def test_set_voltage_sequence_requires_a_connection(fake_dll):
+    controller = PiezoController(Path("Thorlabs.MDT69XB.dll"))
+
+    with pytest.raises(PiezoConnectionError):
+        controller.set_voltage_sequence("x", [1.0])
+    assert fake_dll.set_calls == []
+
+
+@pytest.fixture
+def com_ports(monkeypatch):
+    list_ports = pytest.importorskip("serial.tools.list_ports")
+    ports = ["COM1", "COM3", "COM4", "COM7"]
+    monkeypatch.setattr(list_ports, "comports", lambda: [SimpleNamespace(device=port) for port in ports])
+    PiezoController.clear_device_cache()
+    yield ports
+    PiezoController.clear_device_cache()
+
+
+def test_find_devices_reports_ports_that_open(fake_dll, com_ports, tmp_path):
+    dll_path = tmp_path / "Thorlabs.MDT69XB.dll"
+    dll_path.touch()
+    fake_dll.controller_ports = {b"COM3", b"COM7"}
+
+    assert PiezoController.find_devices(dll_path) == ["COM3", "COM7"]
+    assert sorted(fake_dll.open_calls) == [b"COM1", b"COM3", b"COM4", b"COM7"]
+
+
+def test_device_scans_never_call_the_dll_concurrently(fake_dll, com_ports, tmp_path):
+    dll_paths = []
+    for i in range(3):
+        dll_path = tmp_path / f"copy{i}" / "Thorlabs.MDT69XB.dll"
+        dll_path.parent.mkdir()
+        dll_path.touch()
+        dll_paths.append(dll_path)
+
+    threads = [threading.Thread(target=PiezoController.find_devices, args=(path,)) for path in dll_paths]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fake_dll.open_calls) == 3 * len(com_ports)
+    assert fake_dll.max_calls_in_flight == 1
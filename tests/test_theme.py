@@ -0,0 +1,53 @@
+import re
+
+import pytest
+
+from ui import theme
+
+STYLESHEETS = {
+    "APP_STYLESHEET": theme.APP_STYLESHEET,
+    "CAMERA_PANEL_STYLE": theme.CAMERA_PANEL_STYLE,
+    "CT400_CONTROL_PANEL_STYLE": theme.CT400_CONTROL_PANEL_STYLE,
+}
+
+
+def test_variables_are_exposed_as_literal_tokens():
+    tokens = theme._theme.TOKENS
+
+    assert tokens["c_primary_500"] == "#3b82f6"
+    assert tokens["c_neutral_800"] == "#1f2937"
+    assert tokens["c_radius_full"] == "9999px"
+
+
+def test_generate_substitutes_tokens_and_minifies():
+    template = """
+    /* Primary button */
+    QPushButton#primary {{
+        color: {c_primary_500};
+        padding: {c_space_xs}   {c_space_sm};
+    }}
+    QTabBar::tab:selected , QTabBar::tab:hover {{ border : none; }}
+    """
+
+    assert theme._theme._generate(template) == (
+        "QPushButton#primary{color:#3b82f6;padding:4px 8px;}QTabBar::tab:selected,QTabBar::tab:hover{border:none;}"
+    )
+
+
+def test_minify_keeps_attribute_selectors_and_descendants():
+    qss = 'QLabel#status[status="connected"]  QLabel > QFrame  {  color : red ; }'
+
+    assert theme._Theme._minify(qss) == 'QLabel#status[status="connected"] QLabel>QFrame{color:red;}'
+
+
+@pytest.mark.parametrize("name", STYLESHEETS)
+def test_generated_stylesheets_contain_only_literal_values(name):
+    qss = STYLESHEETS[name]
+
+    assert qss
+    assert "var(" not in qss
+    assert "/*" not in qss
+    assert "\n" not in qss
+    # Every template field was filled in: no `{name}` placeholders and balanced rule blocks.
+    assert not re.search(r"\{\w+\}", qss)
+    assert qss.count("{") == qss.count("}")
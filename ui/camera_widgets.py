@@ -19,13 +19,14 @@ background workers needed for performance.
 import logging
 import math
 import time
+from collections.abc import Callable
 from typing import Literal
 
 import cv2
 import numpy as np
 from PySide6 import QtCore, QtGui
 from PySide6.QtCore import Q_ARG, QMetaObject, QObject, QRunnable, QSize, Qt, QThread, QThreadPool, QTimer, Signal, Slot
-from PySide6.QtGui import QColor, QFont, QIcon, QImage, QPainter, QPixmap
+from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPixmap
 from PySide6.QtWidgets import (
     QFileDialog,
     QFrame,
@@ -51,6 +52,7 @@ from ui.constants import (
     OP_AUTO_EXPOSURE,
     OP_AUTO_GAIN,
 )
+from ui.icons import resource_icon
 from ui.theme import CAMERA_PANEL_STYLE
 
 logger = logging.getLogger("LabApp.camera_widgets")
@@ -77,10 +79,18 @@ class ImageConversionWorker(QObject):
     image_ready = Signal(QImage)
     conversion_error = Signal(str)
 
-    def __init__(self, is_mono: bool, camera_name: str, parent=None):
+    def __init__(
+        self,
+        is_mono: bool,
+        camera_name: str,
+        release_frame: Callable[[np.ndarray], None] | None = None,
+        parent=None,
+    ):
         super().__init__(parent)
         self.is_mono = is_mono
         self.camera_name = camera_name
+        # Called with every received frame once it has been converted (or skipped).
+        self._release_frame = release_frame
         self._is_running = True
 
     @Slot()
@@ -95,6 +105,14 @@ class ImageConversionWorker(QObject):
         The workhorse method that runs in the background thread.
         Converts the numpy frame to the appropriate QImage format.
         """
+        try:
+            self._convert(frame)
+        finally:
+            if self._release_frame is not None and frame is not None:
+                self._release_frame(frame)
+
+    def _convert(self, frame: np.ndarray):
+        """Converts one frame and emits the resulting QImage; the frame is not used afterwards."""
         if not self._is_running or frame is None or frame.size == 0:
             return
 
@@ -552,7 +570,9 @@ class CameraPanel(QFrame):
 
         self.conversion_thread = QThread(self)
         # Pass necessary info to the worker's constructor
-        self.conversion_worker = ImageConversionWorker(is_mono=self.camera.is_mono, camera_name=self._panel_title)
+        self.conversion_worker = ImageConversionWorker(
+            is_mono=self.camera.is_mono, camera_name=self._panel_title, release_frame=self.camera.release_frame
+        )
         self.conversion_worker.moveToThread(self.conversion_thread)
 
         # Connect signals:
@@ -571,8 +591,8 @@ class CameraPanel(QFrame):
         logger.info(f"Persistent conversion worker created for {self._panel_title}")
 
         # --- CRITICAL: Connect the camera's frame signal to the worker's slot ---
-        # This is the new, efficient pipeline
-        self.camera.new_frame.connect(self.conversion_worker.process_frame)
+        # The worker hands every frame back to the camera's pool once it has converted it.
+        self.camera.attach_frame_consumer(self.conversion_worker.process_frame)
 
     def _update_controls_from_camera(self):
         """Refreshes control widgets with values from the live camera."""
@@ -671,7 +691,7 @@ class CameraPanel(QFrame):
         auto_btn_layout.addStretch(1)
 
         self.screenshot_btn = QPushButton("Screenshot")
-        self.screenshot_btn.setIcon(QIcon(":/icons/save.svg"))
+        self.screenshot_btn.setIcon(resource_icon("save"))
         self.screenshot_btn.setToolTip("Save current frame as image")
         self.screenshot_btn.clicked.connect(self.take_screenshot)
 
@@ -1009,7 +1029,7 @@ class CameraPanel(QFrame):
         if self.camera and self.conversion_worker:
             # Disconnect the signal to prevent sending frames to a closing worker
             try:
-                self.camera.new_frame.disconnect(self.conversion_worker.process_frame)
+                self.camera.detach_frame_consumer(self.conversion_worker.process_frame)
             except (TypeError, RuntimeError):
                 # This can happen if the connection was already broken. Safe to ignore.
                 pass
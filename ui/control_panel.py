@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, ABCMeta, abstractmethod
+from dataclasses import dataclass
 
 import numpy as np
 from PySide6 import QtCore, QtGui
@@ -33,6 +34,7 @@ from PySide6.QtWidgets import (
 from config_model import AppConfig
 from hardware.ct400 import CT400Error
 from hardware.ct400_types import (
+    POWER_ARRAY_DETECTORS,
     CT400StatusCode,  # <-- NEW
     Detector,
     Enable,
@@ -54,10 +56,15 @@ from ui.constants import (
     PROP_MONITORING,
     PROP_SCANNING,
 )
+from ui.icons import resource_icon
 from ui.theme import CT400_CONTROL_PANEL_STYLE
 
 logger = logging.getLogger("LabApp.control_panel")
 
+# Shared fallback for scans that produced no power rows; read-only, so it is safe to hand out to every consumer.
+_EMPTY_F64 = np.empty(0, dtype=np.float64)
+_EMPTY_F64.setflags(write=False)
+
 
 ###############################################################################
 # CT400ConnectionWorker (Refactored for QThreadPool)
@@ -87,14 +94,16 @@ class CT400ConnectionWorker(QRunnable):
     @Slot()
     def run(self):
         """Performs the connection or disconnection logic."""
+        # The config is already a validated, typed model; just bind the section once.
+        scan_defaults = self.config.scan_defaults
         try:
             if self.is_connect_operation:
                 logger.info("ConnectionWorker (Runnable): Starting connection.")
                 gpib = self.config.instruments.tunics_gpib_address
-                laser_input = LaserInput(self.config.scan_defaults.input_port)
-                min_wl = self.config.scan_defaults.min_wavelength_nm
-                max_wl = self.config.scan_defaults.max_wavelength_nm
-                speed = self.config.scan_defaults.speed_nm_s
+                laser_input = LaserInput(scan_defaults.input_port)
+                min_wl = scan_defaults.min_wavelength_nm
+                max_wl = scan_defaults.max_wavelength_nm
+                speed = scan_defaults.speed_nm_s
                 laser_type_str = self.config.instruments.tunics_laser_type
                 laser_type_enum = getattr(LaserSource, laser_type_str, LaserSource.LS_TunicsT100s_HP)
                 self.ct400.set_laser(
@@ -111,9 +120,9 @@ class CT400ConnectionWorker(QRunnable):
                 self.signals.connection_succeeded.emit(success_msg)
             else:
                 logger.info("ConnectionWorker (Runnable): Starting disconnection.")
-                laser_input_disconnect = LaserInput(self.config.scan_defaults.input_port)
-                safe_wl = self.config.scan_defaults.safe_parking_wavelength
-                safe_power = self.config.scan_defaults.laser_power
+                laser_input_disconnect = LaserInput(scan_defaults.input_port)
+                safe_wl = scan_defaults.safe_parking_wavelength
+                safe_power = scan_defaults.laser_power
                 self.ct400.cmd_laser(
                     laser_input=laser_input_disconnect,
                     enable=Enable.DISABLE,
@@ -138,12 +147,14 @@ class CT400ConnectionWorker(QRunnable):
 ###############################################################################
 # ScanSettings
 ###############################################################################
+@dataclass(slots=True)
 class ScanSettings:
-    def __init__(self):
-        self.resolution: str = "N/A"
-        self.motor_speed: str = "N/A"
-        self.laser_power: str = "N/A"
-        self.power_unit: str = ""
+    """Settings of the last scan, shared between the scan panel and the plot's metadata."""
+
+    resolution: str = "N/A"
+    motor_speed: str = "N/A"
+    laser_power: str = "N/A"
+    power_unit: str = ""
 
 
 ###############################################################################
@@ -152,7 +163,12 @@ class ScanSettings:
 # --- REFACTOR: Inherit from QObject for the recommended worker-thread pattern ---
 class ScanWorker(QtCore.QObject):
     _LASER_COMMAND_DELAY_MS = 150
+    # Adaptive polling: start fast so short scans finish promptly, back off to the cap.
+    _SCAN_POLL_INITIAL_MS = 5
     _SCAN_POLL_INTERVAL_MS = 100
+    _SCAN_POLL_BACKOFF = 1.5
+    # Raw status code compared in the poll loop; scan_wait_end returns plain ints.
+    _SCAN_COMPLETED = int(CT400StatusCode.SCAN_COMPLETED)
 
     completed_signal = QtCore.Signal(np.ndarray, np.ndarray, float)
     progress_signal = QtCore.Signal(int)
@@ -222,11 +238,12 @@ class ScanWorker(QtCore.QObject):
             scan_started = True
             logger.info("ScanWorker: CT400 scan started.")
 
+            poll_delay_ms = float(self._SCAN_POLL_INITIAL_MS)
             while self._running:
                 # --- REVISED ERROR HANDLING ---
                 status_code, error_msg = self.ct400.scan_wait_end()
 
-                if status_code == CT400StatusCode.SCAN_COMPLETED:
+                if status_code == self._SCAN_COMPLETED:
                     logger.info("ScanWorker: Scan completed successfully.")
                     self.progress_signal.emit(100)
                     break
@@ -246,7 +263,8 @@ class ScanWorker(QtCore.QObject):
                     self.error_signal.emit(err)
                     return  # Exit cleanly
 
-                QThread.msleep(self._SCAN_POLL_INTERVAL_MS)
+                QThread.msleep(int(poll_delay_ms))
+                poll_delay_ms = min(poll_delay_ms * self._SCAN_POLL_BACKOFF, self._SCAN_POLL_INTERVAL_MS)
 
             if not self._running:
                 logger.info("ScanWorker: Scan cancelled by user.")
@@ -521,6 +539,10 @@ class BaseControlPanel(QWidget, ABC, metaclass=QABCMeta):
 # CT400ControlPanel
 ###############################################################################
 class CT400ControlPanel(BaseControlPanel):
+    # (wavelengths_nm, powers_dbm, final_pout): two 1-D float64 arrays of equal length, passed
+    # through as the worker produced them (the powers are the DE_1 row of the array returned by
+    # get_data_points, which no later scan reuses). Receivers must not re-cast them; the plot
+    # keeps these exact arrays for saving.
     scan_data_ready = QtCore.Signal(np.ndarray, np.ndarray, float)
     progress_updated = QtCore.Signal(int)
 
@@ -584,7 +606,7 @@ class CT400ControlPanel(BaseControlPanel):
         control_layout = QVBoxLayout()
         self.scan_btn = QPushButton("Start Scan")
         self.scan_btn.setObjectName(ID_SCAN_BUTTON)
-        self.scan_btn.setIcon(QtGui.QIcon(":/icons/play.svg"))
+        self.scan_btn.setIcon(resource_icon("play"))
         self.scan_btn.setMinimumHeight(35)
         self.scan_btn.setMinimumWidth(130)
         control_layout.addWidget(self.scan_btn)
@@ -675,7 +697,7 @@ class CT400ControlPanel(BaseControlPanel):
 
             self.scanning = True
             self.scan_btn.setText("Stop Scan")
-            self.scan_btn.setIcon(QtGui.QIcon(":/icons/stop.svg"))
+            self.scan_btn.setIcon(resource_icon("stop"))
             self.scan_btn.setProperty(PROP_SCANNING, True)
             self.scan_btn.style().unpolish(self.scan_btn)
             self.scan_btn.style().polish(self.scan_btn)
@@ -750,7 +772,7 @@ class CT400ControlPanel(BaseControlPanel):
     @Slot(np.ndarray, np.ndarray, float)
     def _handle_scan_completed(self, wavelengths: np.ndarray, powers_scan_data: np.ndarray, final_pout: float):
         logger.info("ScanPanel: Scan completed signal received.")
-        plotting_power_data = np.array([])
+        plotting_power_data = _EMPTY_F64
         try:
             if hasattr(powers_scan_data, "shape") and powers_scan_data.shape[0] > 0:
                 plotting_power_data = powers_scan_data[0]
@@ -780,7 +802,7 @@ class CT400ControlPanel(BaseControlPanel):
     def _reset_scan_ui(self, status_msg: str = MSG_SCAN_READY):
         self.scanning = False
         self.scan_btn.setText("Start Scan")
-        self.scan_btn.setIcon(QtGui.QIcon(":/icons/play.svg"))
+        self.scan_btn.setIcon(resource_icon("play"))
         self.scan_btn.setProperty(PROP_SCANNING, False)
         self.scan_btn.style().unpolish(self.scan_btn)
         self.scan_btn.style().polish(self.scan_btn)
@@ -796,7 +818,9 @@ class CT400ControlPanel(BaseControlPanel):
 ###############################################################################
 class HistogramControlPanel(BaseControlPanel):
     _THREAD_WAIT_TIMEOUT_MS = 2000
-    power_data_ready = QtCore.Signal(dict)
+    # One float64 per monitored detector, in POWER_ARRAY_DETECTORS order (matches detector_cbs);
+    # unchecked or missing detectors read 0.0. The array is freshly allocated per tick.
+    power_data_ready = QtCore.Signal(np.ndarray)
 
     def __init__(
         self,
@@ -815,6 +839,12 @@ class HistogramControlPanel(BaseControlPanel):
 
         self.setObjectName(ID_CT400_MONITOR_PANEL)
 
+        # Laser-disable parameters, resolved once from the typed config (same safe values the scan panel uses).
+        scan_defaults = config.scan_defaults
+        self._default_laser_input = LaserInput(config.histogram_defaults.input_port)
+        self._disable_wavelength = float(scan_defaults.safe_parking_wavelength)
+        self._disable_power = float(scan_defaults.laser_power)
+
         # Initialize subclass-specific UI
         self._init_subclass_ui()
 
@@ -857,7 +887,7 @@ class HistogramControlPanel(BaseControlPanel):
         operation_layout = QVBoxLayout()
         self.monitor_btn = QPushButton("Start Monitoring")
         self.monitor_btn.setObjectName(ID_MONITOR_BUTTON)
-        self.monitor_btn.setIcon(QtGui.QIcon(":/icons/play.svg"))
+        self.monitor_btn.setIcon(resource_icon("play"))
         self.monitor_btn.setMinimumHeight(100)
         self.monitor_btn.setMinimumWidth(150)
         operation_layout.addWidget(self.monitor_btn)
@@ -893,8 +923,7 @@ class HistogramControlPanel(BaseControlPanel):
     def set_instrument(self, ct400_device: AbstractCT400 | None):
         """Overrides base method to also update the worker's device instance."""
         super().set_instrument(ct400_device)
-        if hasattr(self, "power_fetch_worker"):
-            self.power_fetch_worker.ct400 = self.ct400
+        self.power_fetch_worker.ct400 = self.ct400
 
     def _get_configurable_widgets(self) -> list[QWidget]:
         # Note: self.detector_cbs are handled separately in on_instrument_connected
@@ -992,7 +1021,7 @@ class HistogramControlPanel(BaseControlPanel):
             self.power_fetch_worker._is_actually_running = True
 
         self.monitor_btn.setText("Stop Monitoring")
-        self.monitor_btn.setIcon(QtGui.QIcon(":/icons/stop-circle.svg"))
+        self.monitor_btn.setIcon(resource_icon("stop-circle"))
         self.monitor_btn.setProperty(PROP_MONITORING, True)
         self.monitor_btn.style().unpolish(self.monitor_btn)
         self.monitor_btn.style().polish(self.monitor_btn)
@@ -1012,18 +1041,17 @@ class HistogramControlPanel(BaseControlPanel):
         if self.timer.isActive():
             logger.debug("Monitor Panel: Stopping QTimer.")
             self.timer.stop()
-        if hasattr(self, "power_fetch_worker"):
-            QMetaObject.invokeMethod(
-                self.power_fetch_worker,
-                "request_stop",
-                Qt.ConnectionType.QueuedConnection,
-            )
+        QMetaObject.invokeMethod(
+            self.power_fetch_worker,
+            "request_stop",
+            Qt.ConnectionType.QueuedConnection,
+        )
 
         if was_actively_monitoring and not instrument_error_or_disconnect:
             self._perform_laser_disable()
 
         self.monitor_btn.setText("Start Monitoring")
-        self.monitor_btn.setIcon(QtGui.QIcon(":/icons/play.svg"))
+        self.monitor_btn.setIcon(resource_icon("play"))
         self.monitor_btn.setProperty(PROP_MONITORING, False)
         self.monitor_btn.style().unpolish(self.monitor_btn)
         self.monitor_btn.style().polish(self.monitor_btn)
@@ -1035,22 +1063,25 @@ class HistogramControlPanel(BaseControlPanel):
             try:
                 logger.info("Monitor Panel: Disabling laser via _perform_laser_disable.")
                 input_port_data = self.input_port.currentData()
-                if not isinstance(input_port_data, LaserInput):
-                    logger.warning(
-                        f"Monitor Panel: input_port.currentData() was not LaserInput type ({type(input_port_data)}). Falling back to currentText."
-                    )
-                    input_port_str = self.input_port.currentText()
-                    input_port_enum = LaserInput(int(input_port_str))
-                else:
+                if isinstance(input_port_data, LaserInput):
                     input_port_enum = input_port_data
+                else:
+                    # Still disable the port the user selected, read from its label (the port number).
+                    try:
+                        input_port_enum = LaserInput(int(self.input_port.currentText()))
+                    except ValueError:
+                        logger.warning(
+                            "Monitor Panel: Could not parse the selected input port %r. "
+                            "Falling back to the configured default.",
+                            self.input_port.currentText(),
+                        )
+                        input_port_enum = self._default_laser_input
 
-                default_wl_disable = 1550.0
-                default_power_disable = 1.0
                 self.ct400.cmd_laser(
                     input_port_enum,
                     Enable.DISABLE,
-                    float(default_wl_disable),
-                    float(default_power_disable),
+                    self._disable_wavelength,
+                    self._disable_power,
                 )
                 logger.info(f"Monitor Panel: Laser disable command sent for port {input_port_enum.name}.")
             except (CT400Error, ValueError) as e:
@@ -1067,16 +1098,14 @@ class HistogramControlPanel(BaseControlPanel):
 
     @Slot()
     def _request_power_fetch_from_worker(self):
-        if not self.monitoring:
+        # Timer tick: the worker is created in __init__ before any timer can fire, so no existence probe.
+        if not self.monitoring or not self.power_fetch_worker.is_worker_running():
             return
-        if hasattr(self, "power_fetch_worker") and self.power_fetch_worker is not None:
-            if not self.power_fetch_worker.is_worker_running():
-                return
-            QMetaObject.invokeMethod(
-                self.power_fetch_worker,
-                "fetch_power",
-                Qt.ConnectionType.QueuedConnection,
-            )
+        QMetaObject.invokeMethod(
+            self.power_fetch_worker,
+            "fetch_power",
+            Qt.ConnectionType.QueuedConnection,
+        )
 
     @Slot(object)
     def _handle_worker_data_ready(self, power_data_tuple: PowerData):
@@ -1084,38 +1113,22 @@ class HistogramControlPanel(BaseControlPanel):
             logger.debug("Monitor Panel: Received worker data but no longer monitoring. Discarding.")
             return
 
-        logger.debug(
-            f"Monitor Panel (Main Thread): Received power data from worker: Pout={power_data_tuple.pout}, Detectors={power_data_tuple.detectors}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Monitor Panel (Main Thread): Received power data from worker: Pout=%s, Detectors=%s",
+                power_data_tuple.pout,
+                power_data_tuple.detectors,
+            )
         try:
-            detector_string_map = {
-                Detector.DE_1: "Det 1",
-                Detector.DE_2: "Det 2",
-                Detector.DE_3: "Det 3",
-                Detector.DE_4: "Det 4",
-            }
-            mapped_detector_values = {}
-            if power_data_tuple.detectors:
-                for i, enum_key in enumerate(detector_string_map.keys()):
-                    if enum_key in power_data_tuple.detectors and i < len(self.detector_cbs):
-                        str_key = detector_string_map[enum_key]
-                        is_checked = self.detector_cbs[i].isChecked()
-                        if is_checked:
-                            mapped_detector_values[str_key] = power_data_tuple.detectors[enum_key]
-                        else:
-                            mapped_detector_values[str_key] = 0.0
-                    elif enum_key not in power_data_tuple.detectors:
-                        str_key = detector_string_map.get(enum_key)
-                        if str_key:
-                            mapped_detector_values[str_key] = 0.0
-                            logger.debug(f"Monitor Panel: No data from CT400 for {str_key}, setting to 0.")
-
-            emit_data = {
-                "pout": power_data_tuple.pout,
-                "detectors": mapped_detector_values,
-            }
-            logger.debug(f"Monitor Panel (Main Thread): Emitting processed power data for UI: {emit_data}")
-            self.power_data_ready.emit(emit_data)
+            detectors = power_data_tuple.detectors
+            detector_values = np.zeros(len(self.detector_cbs))
+            for i, (det, cb) in enumerate(zip(POWER_ARRAY_DETECTORS, self.detector_cbs)):
+                value = detectors.get(det)
+                if value is None:
+                    logger.debug("Monitor Panel: No data from CT400 for %s, setting to 0.", cb.text())
+                elif cb.isChecked():
+                    detector_values[i] = value
+            self.power_data_ready.emit(detector_values)
         except Exception as e:
             logger.exception(f"Monitor Panel (Main Thread): Error processing worker data: {e}")
 
@@ -1135,7 +1148,7 @@ class HistogramControlPanel(BaseControlPanel):
         if self.monitoring:
             logger.info("HistogramControlPanel.cleanup: Monitoring was active, stopping it first.")
             self._stop_monitoring()
-        if hasattr(self, "power_fetch_thread") and self.power_fetch_thread.isRunning():
+        if self.power_fetch_thread.isRunning():
             logger.info("HistogramControlPanel.cleanup: Quitting power fetch thread.")
             self.power_fetch_thread.quit()
             if not self.power_fetch_thread.wait(self._THREAD_WAIT_TIMEOUT_MS):
@@ -1144,7 +1157,7 @@ class HistogramControlPanel(BaseControlPanel):
                 self.power_fetch_thread.wait()
             else:
                 logger.info("Power fetch worker thread quit gracefully during cleanup.")
-        elif hasattr(self, "power_fetch_thread"):
+        else:
             logger.info("Power fetch worker thread was not running at cleanup.")
 
     @Slot()
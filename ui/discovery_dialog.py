@@ -1,9 +1,8 @@
 import logging
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QAbstractItemView,
-    QApplication,
     QDialog,
     QDialogButtonBox,
     QHBoxLayout,
@@ -73,13 +72,18 @@ class CameraDiscoveryDialog(QDialog):
 
     def populate_table(self):
         """
-        Clears the table and repopulates it by calling the static VimbaCam method.
+        Clears the table and schedules the blocking camera query.
+
+        The query runs from the next event-loop turn, so the cleared table and the
+        wait cursor are shown first without re-entering the event loop.
         """
         self.table.setRowCount(0)  # Clear existing rows
         self.refresh_button.setEnabled(False)
         self.setCursor(Qt.CursorShape.WaitCursor)
-        QApplication.processEvents()  # Update UI to show wait cursor
+        QTimer.singleShot(0, self._fill_table)
 
+    def _fill_table(self):
+        """Repopulates the table by calling the static VimbaCam method."""
         try:
             cameras_info = VimbaCam.list_cameras()
             if not cameras_info:
@@ -0,0 +1,16 @@
+"""
+Shared access to the SVG icons compiled into the Qt resource file.
+
+Every widget gets its icons from `resource_icon`, so each SVG is decoded once per
+process no matter how many widgets or state changes use it.
+"""
+
+import functools
+
+from PySide6.QtGui import QIcon
+
+
+@functools.cache
+def resource_icon(name: str) -> QIcon:
+    """Returns the ':/icons/<name>.svg' icon, decoding each one only once per process."""
+    return QIcon(f":/icons/{name}.svg")
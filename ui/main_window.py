@@ -16,14 +16,18 @@ for the entire graphical user interface. Its responsibilities include:
     application closes.
 """
 
+import functools
 import logging
 import sys
+import time
+from collections import deque
 from enum import Enum, auto
+from typing import TYPE_CHECKING
 
 import numpy as np
 from PySide6 import QtGui, QtWidgets
-from PySide6.QtCore import QObject, QRunnable, QSize, Qt, QThread, QThreadPool, QTimer, Signal, Slot
-from PySide6.QtGui import QAction, QFont, QIcon
+from PySide6.QtCore import QEventLoop, QObject, QRunnable, QSize, Qt, QThread, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QAction, QFont
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -39,7 +43,6 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from vmbpy import VmbCameraError, VmbSystem, VmbSystemError
 
 from config_model import AppConfig, CameraConfig
 from hardware.ct400_init_worker import CT400InitWorker
@@ -48,7 +51,7 @@ from hardware.piezo import PiezoController
 from hardware.piezo_init_worker import PiezoInitWorker
 from logic.task_runner import TaskRunner
 from ui.alignment_panel import AlignmentPanel
-from ui.discovery_dialog import CameraDiscoveryDialog
+from ui.icons import resource_icon
 from ui.theme import CT400_CONTROL_PANEL_STYLE
 
 try:
@@ -61,15 +64,11 @@ except ImportError:
         file=sys.stderr,
     )
 
-from hardware.camera import VimbaCam
-from hardware.camera_init_worker import CameraInitWorker
 from hardware.ct400 import CT400
 from hardware.interfaces import AbstractCT400
-from ui.camera_widgets import CameraPanel
 from ui.constants import (
     ID_CT400_STATUS_LABEL,
     MSG_CAMERA_CONNECTING,
-    MSG_CAMERA_FAILED,
     MSG_CAMERA_WAITING,
     PROP_STATUS,
 )
@@ -81,6 +80,14 @@ from ui.control_panel import (
 )
 from ui.plot_widgets import HistogramWidget, PlotWidget
 
+if TYPE_CHECKING:
+    # The camera stack pulls in vmbpy and the Vimba SDK; it is imported where it is first
+    # needed (after the window is shown), so it stays out of the startup import path.
+    from vmbpy import VmbSystem
+
+    from hardware.camera import VimbaCam
+    from ui.camera_widgets import CameraPanel
+
 logger = logging.getLogger("LabApp.main_window")
 
 
@@ -129,6 +136,18 @@ class CT400Status(Enum):
     UNKNOWN = auto()
 
 
+# Per-state CT400 visuals: (action text, icon key, action enabled, action checked, status label text).
+_CT400_STATE_VISUALS: dict[CT400Status, tuple[str, str, bool, bool, str]] = {
+    CT400Status.CONNECTED: ("Disconnect CT400", "disconnect", True, True, "CT400: Connected"),
+    CT400Status.DISCONNECTED: ("Connect CT400", "connect", True, False, "CT400: Disconnected"),
+    CT400Status.CONNECTING: ("Connecting...", "spinner", False, True, "CT400: Connecting"),
+    CT400Status.DISCONNECTING: ("Disconnecting...", "spinner", False, False, "CT400: Disconnecting"),
+    CT400Status.ERROR: ("Connect CT400 (Error)", "connect", True, False, "CT400: Error"),
+    CT400Status.UNAVAILABLE: ("CT400 Unavailable", "laser", False, False, "CT400: Unavailable"),
+    CT400Status.UNKNOWN: ("CT400 Initializing", "spinner", False, False, "CT400: Unknown"),
+}
+
+
 class MainWindow(QMainWindow):
     """The main application window.
 
@@ -144,6 +163,12 @@ class MainWindow(QMainWindow):
             which could be a real or dummy implementation.
     """
 
+    _SCAN_PLOT_DEBOUNCE_MS = 33
+    _SHUTDOWN_CLOSE_TIMEOUT_MS = 2000  # Upper bound on waiting for camera/CT400 close() at exit
+    _SHUTDOWN_POLL_MS = 20  # How often the shutdown wait checks whether the close calls have finished
+    _PROGRESS_MIN_INTERVAL_S = 0.1  # Status-bar progress is refreshed at most 10 times a second
+    _PROGRESS_MESSAGE = "Scan Progress: {}%"
+
     def __init__(self, config: AppConfig, parent=None):
         """Initializes the MainWindow.
 
@@ -159,8 +184,11 @@ class MainWindow(QMainWindow):
         logger.info("Initializing MainWindow...")
         # --- Member variable initialization ---
         self.cameras: list[VimbaCam] = []
+        # Cleared in _cleanup_cameras together with the panels' menu actions, which also reference them.
         self.camera_panels: dict[str, CameraPanel] = {}
-        self.camera_tasks = []
+        self.camera_tasks: list[TaskRunner] = []
+        # Camera configs whose panel/worker setup is still queued on the event loop.
+        self._pending_cameras: deque[tuple[str, CameraConfig]] = deque()
 
         # --- CT400 and Piezo hardware will be None until workers finish ---
         self.ct400_device: AbstractCT400 | None = None
@@ -171,23 +199,52 @@ class MainWindow(QMainWindow):
         self.ct400_init_thread: QThread | None = None
         self.ct400_init_worker: CT400InitWorker | None = None
 
-        # --- Piezo Worker ---
-        self.piezo_init_thread: QThread | None = None
-        self.piezo_init_worker: PiezoInitWorker | None = None
+        # --- Piezo Worker (one-shot, runs on the shared thread pool) ---
+        self.piezo_task: TaskRunner | None = None
 
         self.shared_scan_settings = ScanSettings()
+        # Scan results are drawn at most once per _SCAN_PLOT_DEBOUNCE_MS; only the newest is kept.
+        self._pending_scan: tuple[np.ndarray, np.ndarray, float] | None = None
+        self._scan_plot_timer = QTimer(self)
+        self._scan_plot_timer.setSingleShot(True)
+        self._scan_plot_timer.setInterval(self._SCAN_PLOT_DEBOUNCE_MS)
+        self._scan_plot_timer.timeout.connect(self._flush_scan_plot)
+        self._last_progress_shown: int | None = None
+        self._last_progress_time = 0.0
+        self._shutdown_done = False  # closeEvent may be delivered more than once; hardware is released only once
+        self._shutdown_in_progress = False  # Set while closeEvent waits on the close calls in a local event loop
+        # Pools whose close calls outlived the shutdown wait; kept so their destructors do not block closeEvent.
+        self._pending_close_pools: list[QThreadPool] = []
         self.vmb_instance: VmbSystem | None = None
         self.is_ct400_connected_state: bool = False
-        self.camera_control_actions: dict[str, QAction] = {}
+        self._last_ct400_state: CT400Status | None = None
+        # Latest requested (state, message); bursts of updates are applied once per event-loop pass.
+        self._pending_ct400_visuals: tuple[CT400Status, str | None] | None = None
+        # One reusable timer for the ERROR -> DISCONNECTED fallback; restarting it coalesces bursts of errors.
+        self._ct400_error_recovery_timer = QTimer(self)
+        self._ct400_error_recovery_timer.setSingleShot(True)
+        self._ct400_error_recovery_timer.setInterval(3000)
+        self._ct400_error_recovery_timer.timeout.connect(
+            lambda: self._update_ct400_visuals(CT400Status.DISCONNECTED, "Error occurred. Ready to connect.")
+        )
+        # Per-camera "Show/Hide Controls" actions, in creation order. They dispatch through
+        # closures, so nothing looks them up by identifier; the list only exists for cleanup.
+        self.camera_control_actions: list[QAction] = []
         self.cameras_menu: QMenu | None = None
 
+        # --- Widgets built by _init_ui (the Power Monitor pair only on first use) ---
+        self.control_panel: CT400ControlPanel | None = None
+        self.plot_widget: PlotWidget | None = None
+        self.histogram_control: HistogramControlPanel | None = None
+        self.histogram_widget: HistogramWidget | None = None
+        self.alignment_tab: AlignmentPanel | None = None
+        self.ct400_status_label: QLabel | None = None
+        self.ct400_connect_action: QAction | None = None
+        self.ct400_task: TaskRunner | None = None
+
         self.piezo_connection_succeeded.connect(self._on_piezo_connection_success)
         self.piezo_connection_failed.connect(self._on_piezo_connection_failed)
 
-        # Threading members for asynchronous camera initialization
-        self.camera_init_threads: list[QThread] = []
-        self.camera_init_workers: list[CameraInitWorker] = []
-
         # --- UI and deferred initialization ---
         self._init_ui()
         self._load_defaults_from_config()
@@ -293,12 +350,14 @@ class MainWindow(QMainWindow):
 
         # Now that the device exists, pass it to the control panels
         self.control_panel.set_instrument(self.ct400_device)
-        self.histogram_control.set_instrument(self.ct400_device)
+        if self.histogram_control:
+            self.histogram_control.set_instrument(self.ct400_device)
 
         # Update UI visuals based on whether the device is real or dummy
         is_real_ct400 = isinstance(self.ct400_device, CT400)
         self.control_panel.on_instrument_connected(is_real_ct400)
-        self.histogram_control.on_instrument_connected(is_real_ct400)
+        if self.histogram_control:
+            self.histogram_control.on_instrument_connected(is_real_ct400)
 
         if is_real_ct400:
             self._update_ct400_visuals(state=CT400Status.DISCONNECTED, message="CT400 Ready (Disconnected)")
@@ -359,11 +418,9 @@ class MainWindow(QMainWindow):
         worker.piezos_initialized.connect(self._on_piezos_initialized)
         worker.initialization_failed.connect(self._on_piezo_init_failed)
 
-        # TaskRunner handles thread creation, starting, and cleanup
-        self.piezo_task = TaskRunner(worker)
+        # Discovery is a short one-shot task, so it runs on the shared thread pool
+        self.piezo_task = TaskRunner(worker, use_pool=True)
         self.piezo_task.start()
-        # --- NEW: Expose the thread for isRunning() checks ---
-        self.piezo_init_thread = self.piezo_task.thread
 
     def _start_vimbasystem(self):
         """Initializes and enters the main VimbaSystem context.
@@ -373,6 +430,8 @@ class MainWindow(QMainWindow):
         if self.vmb_instance is not None:
             logger.info("VmbSystem already active.")
             return
+        from vmbpy import VmbSystem, VmbSystemError
+
         try:
             logger.info("Attempting to start VmbSystem...")
             self.vmb_instance = VmbSystem.get_instance()
@@ -398,6 +457,8 @@ class MainWindow(QMainWindow):
     def _cleanup_vimbasystem(self):
         """Exits the VimbaSystem context cleanly."""
         if self.vmb_instance:
+            from vmbpy import VmbSystemError
+
             logger.info("Attempting to exit VmbSystem...")
             try:
                 self.vmb_instance.__exit__(None, None, None)
@@ -413,7 +474,7 @@ class MainWindow(QMainWindow):
         """Load default values from config into UI elements."""
         logger.debug("Loading UI defaults from configuration...")
         try:
-            if hasattr(self, "control_panel") and self.control_panel:
+            if self.control_panel is not None:
                 scan_defaults = self.config.scan_defaults
                 self.control_panel.initial_wl.setText(str(scan_defaults.start_wavelength_nm))
                 self.control_panel.final_wl.setText(str(scan_defaults.end_wavelength_nm))
@@ -428,30 +489,32 @@ class MainWindow(QMainWindow):
                         self.control_panel.input_port.setCurrentIndex(i)
                         break
 
-            if hasattr(self, "histogram_control") and self.histogram_control:
-                hist_defaults = self.config.histogram_defaults
-                self.histogram_control.wavelength_input.setText(str(hist_defaults.wavelength_nm))
-                self.histogram_control.laser_power.setText(str(hist_defaults.laser_power))
-                power_unit_idx_hist = self.histogram_control.power_unit.findText(hist_defaults.power_unit)
-                if power_unit_idx_hist != -1:
-                    self.histogram_control.power_unit.setCurrentIndex(power_unit_idx_hist)
-                for i in range(self.histogram_control.input_port.count()):
-                    if self.histogram_control.input_port.itemData(i).value == hist_defaults.input_port:
-                        self.histogram_control.input_port.setCurrentIndex(i)
-                        break
-                if hasattr(self.histogram_control, "detector_cbs"):
-                    for i, checkbox in enumerate(self.histogram_control.detector_cbs):
-                        is_enabled = getattr(hist_defaults, f"detector_{i + 1}_enabled", False)
-                        checkbox.setChecked(is_enabled)
+            if self.histogram_control is not None:
+                self._load_histogram_defaults()
         except Exception as e:
             logger.error(f"Error loading defaults from config: {e}", exc_info=True)
-            self.statusBar.showMessage("Error loading defaults from config", 5000)
+            self.statusBar().showMessage("Error loading defaults from config", 5000)
+
+    def _load_histogram_defaults(self):
+        """Load the Power Monitor defaults from config into the histogram control panel."""
+        hist_defaults = self.config.histogram_defaults
+        self.histogram_control.wavelength_input.setText(str(hist_defaults.wavelength_nm))
+        self.histogram_control.laser_power.setText(str(hist_defaults.laser_power))
+        power_unit_idx_hist = self.histogram_control.power_unit.findText(hist_defaults.power_unit)
+        if power_unit_idx_hist != -1:
+            self.histogram_control.power_unit.setCurrentIndex(power_unit_idx_hist)
+        for i in range(self.histogram_control.input_port.count()):
+            if self.histogram_control.input_port.itemData(i).value == hist_defaults.input_port:
+                self.histogram_control.input_port.setCurrentIndex(i)
+                break
+        for checkbox, is_enabled in zip(self.histogram_control.detector_cbs, hist_defaults.detectors_enabled):
+            checkbox.setChecked(is_enabled)
 
     def _init_ui(self):
         """Constructs the main user interface of the application."""
         logger.debug("Initializing UI...")
         self.setWindowTitle(self.config.app_name)
-        self.setWindowIcon(QIcon(":/icons/laser.svg"))
+        self.setWindowIcon(resource_icon("laser"))
         self.setMinimumSize(1200, 800)
 
         try:
@@ -497,14 +560,15 @@ class MainWindow(QMainWindow):
         first_tab_layout.addWidget(self.plot_widget, stretch=1)
         self.tab_widget.addTab(self.first_tab, "Wavelength Scan")
 
+        # The Power Monitor tab is only a stub until the user first opens it (see _build_power_monitor_tab).
         self.second_tab = QWidget()
         second_tab_layout = QHBoxLayout(self.second_tab)
-        self.histogram_control = HistogramControlPanel(None, self.config)
-        hist_detector_keys = [cb.text() for cb in self.histogram_control.detector_cbs]
-        self.histogram_widget = HistogramWidget(self.histogram_control, hist_detector_keys)
-        second_tab_layout.addWidget(self.histogram_control, stretch=0)
-        second_tab_layout.addWidget(self.histogram_widget, stretch=1)
+        self._hist_placeholder = QLabel("Loading…")
+        self._hist_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        second_tab_layout.addWidget(self._hist_placeholder)
+        self._hist_built = False
         self.tab_widget.addTab(self.second_tab, "Power Monitor")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         self.alignment_tab = AlignmentPanel(None, None, None, self)
         self.alignment_tab.setStyleSheet(CT400_CONTROL_PANEL_STYLE)
@@ -578,55 +642,102 @@ class MainWindow(QMainWindow):
         self.piezo_connect_right_action.setEnabled(False)
         # The tab remains disabled, so no further action is needed on it.
 
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        """Builds the Power Monitor tab the first time it is shown."""
+        if not self._hist_built and self.tab_widget.widget(index) is self.second_tab:
+            self._build_power_monitor_tab()
+
+    def _build_power_monitor_tab(self):
+        """Replaces the Power Monitor stub with the histogram control panel and widget."""
+        logger.debug("Building Power Monitor tab...")
+        self._hist_built = True
+        self.histogram_control = HistogramControlPanel(None, self.config)
+        hist_detector_keys = [cb.text() for cb in self.histogram_control.detector_cbs]
+        self.histogram_widget = HistogramWidget(self.histogram_control, hist_detector_keys)
+
+        layout = self.second_tab.layout()
+        layout.removeWidget(self._hist_placeholder)
+        self._hist_placeholder.deleteLater()
+        self._hist_placeholder = None
+        layout.addWidget(self.histogram_control, stretch=0)
+        layout.addWidget(self.histogram_widget, stretch=1)
+
+        try:
+            self._load_histogram_defaults()
+        except Exception as e:
+            logger.error(f"Error loading histogram defaults from config: {e}", exc_info=True)
+        self.histogram_control.power_data_ready.connect(self.handle_power_data)
+
+        # Catch up with the CT400 state; the scan panel has received every update so far.
+        if self.ct400_device:
+            self.histogram_control.set_instrument(self.ct400_device)
+        self.histogram_control.on_instrument_connected(self.control_panel.is_instrument_connected)
+
     def _update_ct400_visuals(self, state: CT400Status, message: str | None = None):
         """Updates all UI elements related to the CT400 connection status.
 
         This centralizes the logic for updating the menu action, status bar label,
-        and main status message based on the device's state.
+        and main status message based on the device's state. The widgets are
+        updated on the next event-loop pass, so a burst of calls collapses into
+        a single update showing the latest state.
 
         Args:
             state: The new CT400Status to reflect in the UI.
             message: An optional message to display in the status bar.
         """
-        action = getattr(self, "ct400_connect_action", None)
-        label = getattr(self, "ct400_status_label", None)
-        if not action or not label:
+        # The connection flag is read synchronously (e.g. by closeEvent), so it is never deferred.
+        self.is_ct400_connected_state = state == CT400Status.CONNECTED
+        if self._pending_ct400_visuals is None:
+            QTimer.singleShot(0, self._flush_ct400_visuals)
+        self._pending_ct400_visuals = (state, message)
+
+    def _flush_ct400_visuals(self):
+        """Applies the most recent pending CT400 state to the widgets."""
+        pending, self._pending_ct400_visuals = self._pending_ct400_visuals, None
+        if pending is not None:
+            self._apply_ct400_visuals(*pending)
+
+    def _apply_ct400_visuals(self, state: CT400Status, message: str | None):
+        """Sets the connect action, status label and status message for one CT400 state."""
+        action = self.ct400_connect_action
+        label = self.ct400_status_label
+        if action is None or label is None:
             return
 
-        action_enabled, action_checked = True, False
-        status_property = state.name.lower()
-
-        state_map = {
-            CT400Status.CONNECTED: ("Disconnect CT400", ":/icons/disconnect.svg", True, True),
-            CT400Status.DISCONNECTED: ("Connect CT400", ":/icons/connect.svg", True, False),
-            CT400Status.CONNECTING: ("Connecting...", ":/icons/spinner.svg", False, True),
-            CT400Status.DISCONNECTING: ("Disconnecting...", ":/icons/spinner.svg", False, False),
-            CT400Status.ERROR: ("Connect CT400 (Error)", ":/icons/connect.svg", True, False),
-            CT400Status.UNAVAILABLE: ("CT400 Unavailable", ":/icons/laser.svg", False, False),
-            CT400Status.UNKNOWN: ("CT400 Initializing", ":/icons/spinner.svg", False, False),
-        }
-
-        text, icon, action_enabled, action_checked = state_map[state]
-        action.setText(text)
-        action.setIcon(QIcon(icon))
+        text, icon_key, action_enabled, action_checked, label_text = _CT400_STATE_VISUALS[state]
+        # Always refreshed: the device behind the action can change while the state stays the same.
         action.setEnabled(action_enabled and isinstance(self.ct400_device, CT400))
         action.setChecked(action_checked)
 
-        label.setText(f"CT400: {state.name.replace('_', ' ').title()}")
-        label.setProperty(PROP_STATUS, status_property)
-        label.style().unpolish(label)
-        label.style().polish(label)
+        # A repeated state without a new message has nothing else to update.
+        state_changed = state != self._last_ct400_state
+        if not state_changed and message is None:
+            return
+        self._last_ct400_state = state
+
+        status_property = state.name.lower()
+        if state_changed:
+            # setIcon/setText notify every widget showing the action, so only touch them on a real change.
+            action.setText(text)
+            action.setIcon(resource_icon(icon_key))
+            label.setText(label_text)
+
+        # Repolishing re-resolves the stylesheet cascade, so skip it when the property is unchanged.
+        if label.property(PROP_STATUS) != status_property:
+            label.setProperty(PROP_STATUS, status_property)
+            label.style().unpolish(label)
+            label.style().polish(label)
 
         if message:
             timeout = 5000 if state in [CT400Status.CONNECTED, CT400Status.DISCONNECTED, CT400Status.ERROR] else 0
             self.statusBar().showMessage(message, timeout)
 
         if state == CT400Status.ERROR:
-            QTimer.singleShot(
-                3000, lambda: self._update_ct400_visuals(CT400Status.DISCONNECTED, "Error occurred. Ready to connect.")
-            )
-
-        self.is_ct400_connected_state = state == CT400Status.CONNECTED
+            self._ct400_error_recovery_timer.start()
+        else:
+            # Any newer state supersedes a pending error fallback.
+            self._ct400_error_recovery_timer.stop()
 
     def _create_menus(self):
         """Creates the main menu bar and all its actions."""
@@ -634,14 +745,14 @@ class MainWindow(QMainWindow):
         menu_bar = self.menuBar()
 
         file_menu = menu_bar.addMenu("&File")
-        exit_action = QAction(QIcon(":/icons/exit.svg"), "E&xit", self)
+        exit_action = QAction(resource_icon("exit"), "E&xit", self)
         exit_action.setStatusTip("Exit the application")
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
         self.instrument_menu = menu_bar.addMenu("&Instruments")
         # --- NEW: Refresh Action ---
-        refresh_action = QAction(QIcon(":/icons/refresh.svg"), "Refresh Instruments", self)
+        refresh_action = QAction(resource_icon("refresh"), "Refresh Instruments", self)
         refresh_action.setStatusTip("Scan for newly connected CT400 or Piezo devices")
         refresh_action.triggered.connect(self._on_refresh_instruments_triggered)
         self.instrument_menu.addAction(refresh_action)
@@ -687,12 +798,13 @@ class MainWindow(QMainWindow):
 
         # 1. Refresh Piezos
         # We always try to find piezos if requested, unless a scan is already running.
-        if self.piezo_init_thread and self.piezo_init_thread.isRunning():
+        if self.piezo_task and self.piezo_task.is_running():
             logger.info("Piezo discovery already running. Skipping.")
         else:
             # Clean up old task reference if it exists
-            if hasattr(self, "piezo_task"):
-                self.piezo_task = None
+            self.piezo_task = None
+            # An explicit refresh must rescan the COM ports, not reuse the cached discovery.
+            PiezoController.clear_device_cache()
             self._init_piezos_lazy()
 
         # 2. Refresh CT400
@@ -709,8 +821,7 @@ class MainWindow(QMainWindow):
                 self._update_ct400_visuals(state=CT400Status.UNKNOWN, message="Searching for CT400...")
 
                 # Clean up old task reference
-                if hasattr(self, "ct400_task"):
-                    self.ct400_task = None
+                self.ct400_task = None
                 self._init_ct400_lazy()
         else:
             logger.info("CT400 is already connected to real hardware. Skipping refresh.")
@@ -732,6 +843,8 @@ class MainWindow(QMainWindow):
             )
             return
 
+        from ui.discovery_dialog import CameraDiscoveryDialog
+
         try:
             dialog = CameraDiscoveryDialog(self)
             dialog.exec()
@@ -781,21 +894,24 @@ class MainWindow(QMainWindow):
         """Slot to handle a successful CT400 connection."""
         self._update_ct400_visuals(state=CT400Status.CONNECTED, message=message)
         self.control_panel.on_instrument_connected(True)
-        self.histogram_control.on_instrument_connected(True)
+        if self.histogram_control:
+            self.histogram_control.on_instrument_connected(True)
 
     @Slot(str)
     def _handle_ct400_connection_failure(self, error_message: str):
         """Slot to handle a failed CT400 connection or disconnection."""
         self._update_ct400_visuals(state=CT400Status.ERROR, message=error_message)
         self.control_panel.on_instrument_connected(False)
-        self.histogram_control.on_instrument_connected(False)
+        if self.histogram_control:
+            self.histogram_control.on_instrument_connected(False)
 
     @Slot(str)
     def _handle_ct400_disconnection_success(self, message: str):
         """Slot to handle a successful CT400 disconnection."""
         self._update_ct400_visuals(state=CT400Status.DISCONNECTED, message=message)
         self.control_panel.on_instrument_connected(False)
-        self.histogram_control.on_instrument_connected(False)
+        if self.histogram_control:
+            self.histogram_control.on_instrument_connected(False)
 
     def _show_about_dialog(self):
         """Displays the 'About' message box with application info."""
@@ -835,34 +951,50 @@ class MainWindow(QMainWindow):
             logger.info("No valid, enabled cameras to initialize.")
             return
 
-        for identifier, config in camera_configs_to_init.items():
-            logger.debug(f"Setting up initialization for camera '{config.name}' (ID: {identifier})")
+        # Set up one camera per event-loop turn, so the window keeps painting between panels.
+        self._pending_cameras.extend(camera_configs_to_init.items())
+        QTimer.singleShot(0, self._init_next_camera)
 
-            # 1. Create and add the placeholder panel to the UI
-            placeholder_panel = self._create_camera_panel(None, config)
-            self.camera_panels[identifier] = placeholder_panel
-            self.camera_container.layout().addWidget(placeholder_panel)
+    def _init_next_camera(self):
+        """Sets up the next queued camera and reschedules itself until the queue is empty."""
+        if not self._pending_cameras:
+            return
+        identifier, config = self._pending_cameras.popleft()
+        self._init_single_camera(identifier, config)
+        if self._pending_cameras:
+            QTimer.singleShot(0, self._init_next_camera)
+
+    def _init_single_camera(self, identifier: str, config: CameraConfig):
+        """Creates the placeholder panel for one camera and starts its CameraInitWorker."""
+        logger.debug(f"Setting up initialization for camera '{config.name}' (ID: {identifier})")
+
+        # 1. Create and add the placeholder panel to the UI
+        placeholder_panel = self._create_camera_panel(None, config)
+        self.camera_panels[identifier] = placeholder_panel
+        self.camera_container.layout().addWidget(placeholder_panel)
 
-            # Create Worker
-            worker = CameraInitWorker(identifier=identifier, cam_config=config)
-            worker.camera_initialized.connect(self._on_camera_initialized)
+        # Create Worker
+        from hardware.camera_init_worker import CameraInitWorker
 
-            # Create Runner
-            task = TaskRunner(worker)
+        worker = CameraInitWorker(identifier=identifier, cam_config=config)
+        worker.camera_initialized.connect(self._on_camera_initialized)
 
-            # Optional: Remove from list when done to free memory
-            # (This requires a small wrapper or lambda if you want to be perfectly clean)
-            task.worker.finished.connect(lambda t=task: self._cleanup_camera_task(t))
+        # Create Runner
+        task = TaskRunner(worker)
 
-            self.camera_tasks.append(task)
-            task.start()
+        # Optional: Remove from list when done to free memory
+        # (This requires a small wrapper or lambda if you want to be perfectly clean)
+        task.worker.finished.connect(lambda t=task: self._cleanup_camera_task(t))
+
+        self.camera_tasks.append(task)
+        task.start()
 
     def _cleanup_camera_task(self, task):
         if task in self.camera_tasks:
             self.camera_tasks.remove(task)
 
     @Slot(str, object, CameraConfig)
-    def _on_camera_initialized(self, identifier: str, camera_instance: VimbaCam | None, cam_config: CameraConfig):
+    def _on_camera_initialized(self, identifier: str, camera_instance: "VimbaCam | None", cam_config: CameraConfig):
         """Slot to handle a camera that has finished initializing.
 
         This method is called when a `CameraInitWorker` finishes. If the camera
@@ -911,40 +1043,9 @@ class MainWindow(QMainWindow):
             return False
         return True
 
-    def _create_and_open_camera(self, cam_config: "CameraConfig") -> VimbaCam | None:
-        """Creates a VimbaCam instance and attempts to open it. Returns instance or None."""
-        try:
-            cam_instance = VimbaCam(
-                identifier=cam_config.identifier,
-                camera_name=cam_config.name,
-                flip_horizontal=cam_config.flip_horizontal,
-                parent=self,
-            )
-            if not cam_instance.open():
-                logger.error(f"Failed to open camera {cam_config.name} (ID: {cam_config.identifier}).")
-                error_msg = MSG_CAMERA_FAILED.format(cam_config.name)
-                placeholder = self._create_camera_error_placeholder(error_msg)
-                self.camera_container.layout().addWidget(placeholder)
-                cam_instance.close()  # Clean up the failed instance
-                return None
-            return cam_instance
-        except VmbCameraError as e:
-            logger.error(f"Vimba Error initializing camera {cam_config.name} (ID: {cam_config.identifier}): {e}")
-            error_msg = f"{cam_config.name}\n(Vimba Error)"
-            placeholder = self._create_camera_error_placeholder(error_msg)
-            self.camera_container.layout().addWidget(placeholder)
-            return None
-        except Exception as e:
-            logger.error(
-                f"Unexpected error creating camera instance {cam_config.name}: {e}",
-                exc_info=True,
-            )
-            error_msg = f"{cam_config.name}\n(Init Error)"
-            placeholder = self._create_camera_error_placeholder(error_msg)
-            self.camera_container.layout().addWidget(placeholder)
-            return None
+    def _create_camera_panel(self, cam_instance: "VimbaCam | None", cam_config: "CameraConfig") -> "CameraPanel":
+        from ui.camera_widgets import CameraPanel
 
-    def _create_camera_panel(self, cam_instance: VimbaCam | None, cam_config: "CameraConfig") -> CameraPanel:
         panel = CameraPanel(
             cam_instance,
             cam_config.name,
@@ -960,27 +1061,35 @@ class MainWindow(QMainWindow):
 
         return panel
 
-    def _connect_camera_signals(self, cam_instance: VimbaCam, panel: CameraPanel):
+    def _connect_camera_signals(self, cam_instance: "VimbaCam", panel: "CameraPanel"):
         """Connects signals between a camera instance and its UI panel."""
         # The connection to the worker is now handled inside CameraPanel.
         # We only need to connect the signals that the panel itself consumes.
 
+        # These signals are emitted from the Vimba frame-handler thread, so the connection
+        # type is fixed up front instead of being resolved per emit by AutoConnection.
+        queued = Qt.ConnectionType.QueuedConnection
+
         # This connection is now just for the watchdog timer
-        cam_instance.new_frame.connect(panel.process_new_frame_data)
+        cam_instance.new_frame.connect(panel.process_new_frame_data, queued)
 
-        cam_instance.fps_updated.connect(panel.update_fps)
-        cam_instance.error.connect(panel._handle_camera_error_message)
+        cam_instance.fps_updated.connect(panel.update_fps, queued)
+        cam_instance.error.connect(panel._handle_camera_error_message, queued)
 
-    def _create_camera_menu_action(self, cam_instance: VimbaCam, panel: CameraPanel):
+    def _create_camera_menu_action(self, cam_instance: "VimbaCam", panel: "CameraPanel"):
         """Creates and registers a menu action to control the camera panel's visibility."""
+        name = cam_instance.camera_name
+        controls_visible = panel.get_controls_visible()
         action = QAction(self)
         action.setCheckable(True)
-        action.setChecked(panel.get_controls_visible())
-        action.setText(f"{'Hide' if panel.get_controls_visible() else 'Show'} {cam_instance.camera_name} Controls")
-        action.setData(cam_instance.identifier)
-        action.triggered.connect(self._handle_camera_control_toggle)
+        action.setChecked(controls_visible)
+        action.setText(f"{'Hide' if controls_visible else 'Show'} {name} Controls")
+        # Bind the panel and label now, so toggling needs no sender()/panel lookup.
+        action.triggered.connect(
+            lambda checked, p=panel, a=action, n=name: self._toggle_camera_controls(p, a, n, checked)
+        )
         self.cameras_menu.addAction(action)
-        self.camera_control_actions[cam_instance.identifier] = action
+        self.camera_control_actions.append(action)
 
     def _create_camera_error_placeholder(self, message: str) -> QWidget:
         """Helper to create a consistent placeholder for camera errors."""
@@ -1025,20 +1134,10 @@ class MainWindow(QMainWindow):
         return placeholder_widget
 
     @Slot(bool)
-    def _handle_camera_control_toggle(self, checked: bool):
-        action = self.sender()
-        if not isinstance(action, QAction):
-            return
-
-        camera_identifier = action.data()
-        if camera_identifier in self.camera_panels:
-            panel = self.camera_panels[camera_identifier]
-            panel.set_controls_visibility(checked)
-            action.setText(f"{'Hide' if checked else 'Show'} {panel._panel_title} Controls")
-        else:
-            logger.warning(f"Camera panel not found for identifier: {camera_identifier} during toggle.")
-            action.setChecked(not checked)
-            action.setEnabled(False)
+    def _toggle_camera_controls(self, panel: "CameraPanel", action: QAction, name: str, checked: bool):
+        """Shows or hides a camera panel's controls and relabels its menu action."""
+        panel.set_controls_visibility(checked)
+        action.setText(f"{'Hide' if checked else 'Show'} {name} Controls")
 
     @Slot(np.ndarray, np.ndarray, float)
     def _handle_scan_data(
@@ -1047,83 +1146,129 @@ class MainWindow(QMainWindow):
         plotting_power_data: np.ndarray,
         final_pout: float,
     ):
-        logger.debug(f"Received scan data signal. Wavelength points: {len(wavelengths)}")
+        logger.debug("Received scan data signal. Wavelength points: %d", len(wavelengths))
 
-        if self.plot_widget and hasattr(self.plot_widget, "update_plot"):
-            try:
-                self.plot_widget.update_plot(wavelengths, plotting_power_data, final_pout)
-            except Exception as e:
-                logger.error(f"Error updating plot widget: {e}", exc_info=True)
+        # Keep only the most recent result; the plot is redrawn once the debounce window closes.
+        self._pending_scan = (wavelengths, plotting_power_data, final_pout)
+        if not self._scan_plot_timer.isActive():
+            self._scan_plot_timer.start()
 
-    @Slot(dict)
-    def handle_power_data(self, power_data: dict):
-        logger.debug(f"Received power data: {power_data}")
-        if self.histogram_widget and hasattr(self.histogram_widget, "schedule_update"):
+    @Slot()
+    def _flush_scan_plot(self):
+        """Draws the latest scan result received during the debounce window."""
+        pending, self._pending_scan = self._pending_scan, None
+        if pending is None or self.plot_widget is None:
+            return
+        try:
+            self.plot_widget.update_plot(*pending)
+        except Exception as e:
+            logger.error(f"Error updating plot widget: {e}", exc_info=True)
+
+    @Slot(np.ndarray)
+    def handle_power_data(self, power_data: np.ndarray):
+        # Runs on every monitor tick: format lazily, and only repr the array when DEBUG is on.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received power data: %s", power_data)
+        if self.histogram_widget is not None:
             try:
                 self.histogram_widget.schedule_update(power_data)
             except Exception as e:
                 logger.error(f"Error updating histogram widget: {e}", exc_info=True)
         else:
-            logger.warning("Histogram widget not available or does not have schedule_update method.")
+            logger.warning("Histogram widget not available; dropping power data.")
 
-    def _cleanup_cameras(self):
+    def _cleanup_cameras(self, close_pool: QThreadPool):
+        """Tears down the camera UI and starts closing each camera on `close_pool` (the caller waits)."""
         logger.info(f"Closing {len(self.cameras)} camera(s)...")
-
-        # Stop any camera initialization threads that might still be running.
-        # Iterate over a copy as the list might be modified by the thread's finished signal.
-        threads_to_stop = list(self.camera_init_threads)
-        for thread in threads_to_stop:
-            if thread.isRunning():
+        # Drop cameras whose setup has not been started yet.
+        self._pending_cameras.clear()
+
+        # Stop any camera initialization tasks that might still be running.
+        # Iterate over a copy as the list might be modified by the worker's finished signal.
+        tasks_to_stop = list(self.camera_tasks)
+        for task in tasks_to_stop:
+            if task.thread.isRunning():
                 logger.warning("Force-quitting an incomplete camera init thread during shutdown.")
-                thread.quit()
-                thread.wait(500)  # Give it a moment to quit
-        self.camera_init_threads.clear()
-        self.camera_init_workers.clear()
+                task.thread.quit()
+                task.thread.wait(500)  # Give it a moment to quit
+        self.camera_tasks.clear()
 
         # Disconnect menu actions
-        if hasattr(self, "cameras_menu") and self.cameras_menu is not None:
-            for cam_id in list(self.camera_control_actions.keys()):
-                action = self.camera_control_actions.pop(cam_id, None)
-                if action:
-                    self.cameras_menu.removeAction(action)
-                    action.deleteLater()
+        if self.cameras_menu is not None:
+            for action in self.camera_control_actions:
+                self.cameras_menu.removeAction(action)
+                action.deleteLater()
         self.camera_control_actions.clear()
 
         # Remove panels from the UI
-        if hasattr(self, "camera_container") and self.camera_container.layout() is not None:
+        if self.camera_container.layout() is not None:
             layout = self.camera_container.layout()
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                if widget is not None:
-                    # This ensures the panel's own closeEvent is called if it has one
-                    widget.close()
-                    widget.deleteLater()
+            # Suspend painting so the removals cost one relayout, and take items from the
+            # end so the layout does not shift the remaining entries on every removal.
+            self.camera_container.setUpdatesEnabled(False)
+            try:
+                for i in reversed(range(layout.count())):
+                    item = layout.takeAt(i)
+                    widget = item.widget()
+                    if widget is not None:
+                        # This ensures the panel's own closeEvent is called if it has one
+                        widget.close()
+                        widget.deleteLater()
+            finally:
+                self.camera_container.setUpdatesEnabled(True)
+                self.camera_container.updateGeometry()
 
         # Close the actual camera hardware instances
         cameras_to_close = list(self.cameras)
         self.cameras.clear()
         self.camera_panels.clear()
 
+        # Each close() stops streaming and releases the device; they are independent, so run them side by side.
         for cam in cameras_to_close:
             if cam is not None:
-                logger.debug(f"Closing camera: {cam.camera_name}")
-                try:
-                    # The camera's close() method handles stopping streaming etc.
-                    cam.close()
-                except Exception as e:
-                    logger.error(f"Error closing camera {cam.camera_name}: {e}", exc_info=True)
+                # Its receivers are gone with the panels; keep close() from emitting on a pool thread.
+                cam.blockSignals(True)
+                close_pool.start(functools.partial(self._close_camera, cam))
 
-        logger.info("Camera cleanup finished.")
+        logger.info("Camera cleanup started.")
+
+    @staticmethod
+    def _close_camera(cam: "VimbaCam"):
+        """Closes one camera; runs on the shutdown pool, so errors are logged rather than raised."""
+        logger.debug(f"Closing camera: {cam.camera_name}")
+        try:
+            # The camera's close() method handles stopping streaming etc.
+            cam.close()
+        except Exception as e:
+            logger.error(f"Error closing camera {cam.camera_name}: {e}", exc_info=True)
+
+    @staticmethod
+    def _close_ct400(device: AbstractCT400):
+        """Closes the CT400 connection; runs on the shutdown pool."""
+        try:
+            device.close()
+        except Exception as e:
+            logger.error(f"Error closing CT400 device: {e}", exc_info=True)
 
     def closeEvent(self, event: QtGui.QCloseEvent):
         """
         Handles the user closing the window. Ensures all hardware and threads
         are shut down gracefully. This is the single source of truth for cleanup.
         """
+        if self._shutdown_done:
+            event.accept()
+            return
+        if self._shutdown_in_progress:
+            # Delivered again while the first call waits on the close calls; that call accepts.
+            event.ignore()
+            return
+        self._shutdown_in_progress = True
         logger.info("Application close requested. Initiating shutdown sequence...")
         self.statusBar().showMessage("Shutting down...", 0)
 
+        # 0. Stop feeding the plots: late scan/power signals must not reach widgets being torn down.
+        self._disconnect_data_signals()
+
         # 1. Stop all worker threads and background tasks first.
         #    This prevents them from trying to access hardware that is about to be disconnected.
 
@@ -1136,27 +1281,29 @@ class MainWindow(QMainWindow):
                 logger.warning("CT400 init thread did not quit gracefully on close.")
                 self.ct400_init_thread.terminate()
 
-        # Quit the piezo init thread if it's still running (it shouldn't be, but this is safe).
-        if self.piezo_init_thread and self.piezo_init_thread.isRunning():
-            logger.info("MainWindow.closeEvent: Quitting active piezo init thread.")
-            self.piezo_init_thread.quit()
-            if not self.piezo_init_thread.wait(500):
-                logger.warning("Piezo init thread did not quit gracefully on close.")
-                self.piezo_init_thread.terminate()  # Force terminate if stuck
+        # Ask a still-running piezo discovery to stop (it shouldn't be running, but this is safe).
+        if self.piezo_task and self.piezo_task.is_running():
+            logger.info("MainWindow.closeEvent: Stopping active piezo discovery task.")
+            self.piezo_task.stop()
 
         # Cleanup long-running workers
-        if hasattr(self, "alignment_tab") and self.alignment_tab:
+        if self.alignment_tab is not None:
             self.alignment_tab.cleanup()
-        if hasattr(self, "histogram_control") and self.histogram_control:
+        if self.histogram_control is not None:
             self.histogram_control.cleanup_worker_thread()
-        if hasattr(self, "control_panel") and self.control_panel.is_busy():
+        if self.control_panel is not None and self.control_panel.is_busy():
             self.control_panel._stop_scan(cancelled=True)
             if self.control_panel.scan_thread:
                 self.control_panel.scan_thread.wait(1000)
 
         # 2. Close all camera streams and wait for any remaining init threads.
-        #    (This also implicitly calls the close() method on each VimbaCam instance).
-        self._cleanup_cameras()
+        #    The blocking close() calls run on private pools while a local event loop keeps the UI
+        #    painting; cameras get their own pool so the Vimba shutdown can tell when they are done.
+        camera_pool = QThreadPool()
+        camera_pool.setMaxThreadCount(max(1, len(self.cameras)))
+        self._cleanup_cameras(camera_pool)
+        ct400_pool = QThreadPool()
+        ct400_pool.setMaxThreadCount(1)
 
         # 3. Disconnect from physical hardware.
         if self.piezo_left and self.piezo_left.is_connected():
@@ -1167,27 +1314,101 @@ class MainWindow(QMainWindow):
         # Disconnect from CT400 if it was connected.
         if self.ct400_device and self.is_ct400_connected_state:
             logger.info("MainWindow.closeEvent: Closing CT400 device connection.")
-            self.ct400_device.close()
+            ct400_pool.start(functools.partial(self._close_ct400, self.ct400_device))
+
+        close_pools = (camera_pool, ct400_pool)
+        if not self._wait_for_pools(close_pools, self._SHUTDOWN_CLOSE_TIMEOUT_MS):
+            logger.warning(
+                "Hardware close calls still running after %d ms; continuing shutdown.",
+                self._SHUTDOWN_CLOSE_TIMEOUT_MS,
+            )
+            self._pending_close_pools.extend(pool for pool in close_pools if not pool.waitForDone(0))
 
-        # 4. Shut down the main Vimba system API.
-        self._cleanup_vimbasystem()
+        # 4. Shut down the main Vimba system API, but never under a camera that is still closing.
+        if camera_pool.waitForDone(0):
+            self._cleanup_vimbasystem()
+        else:
+            logger.warning("Camera close calls still running; leaving the Vimba system open.")
 
+        self._shutdown_done = True
+        self._shutdown_in_progress = False
         logger.info("Shutdown sequence complete. Accepting close event.")
         event.accept()
 
+    def _wait_for_pools(self, pools: tuple[QThreadPool, ...], timeout_ms: int) -> bool:
+        """
+        Processes events until every pool is idle or `timeout_ms` elapses; returns True if all finished.
+        User input is held back meanwhile, so nothing new can be started during shutdown.
+        """
+
+        def all_done() -> bool:
+            return all(pool.waitForDone(0) for pool in pools)
+
+        if all_done():
+            return True
+        loop = QEventLoop()
+
+        def quit_when_done():
+            if all_done():
+                loop.quit()
+
+        poll_timer = QTimer()
+        poll_timer.setInterval(self._SHUTDOWN_POLL_MS)
+        poll_timer.timeout.connect(quit_when_done)
+        deadline_timer = QTimer()
+        deadline_timer.setSingleShot(True)
+        deadline_timer.timeout.connect(loop.quit)
+        poll_timer.start()
+        deadline_timer.start(timeout_ms)
+        loop.exec(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+        poll_timer.stop()
+        deadline_timer.stop()
+        return all_done()
+
+    @Slot(int)
+    def _on_scan_progress(self, value: int):
+        """Mirrors scan progress in the status bar, skipping repeats and ticks closer than 100 ms."""
+        now = time.monotonic()
+        # The final 100% is always shown (it is the message that stays up, and it ends every scan).
+        if value < 100 and (
+            value == self._last_progress_shown or now - self._last_progress_time < self._PROGRESS_MIN_INTERVAL_S
+        ):
+            return
+        self._last_progress_shown = value
+        self._last_progress_time = now
+        self.statusBar().showMessage(self._PROGRESS_MESSAGE.format(value), 1000 if value < 100 else 0)
+
+    def _disconnect_data_signals(self):
+        """Detaches the plot data slots and stops the UI timers that would redraw them."""
+        connections = (
+            (self.control_panel, "scan_data_ready", self._handle_scan_data),
+            (self.histogram_control, "power_data_ready", self.handle_power_data),
+        )
+        for source, signal_name, slot in connections:
+            if source is None:
+                continue
+            try:
+                getattr(source, signal_name).disconnect(slot)
+            except (RuntimeError, TypeError) as e:
+                # Raised when the slot was never connected; nothing to undo.
+                logger.debug(f"{signal_name} was not connected: {e}")
+
+        self._scan_plot_timer.stop()
+        self._pending_scan = None
+        self._ct400_error_recovery_timer.stop()
+        self._pending_ct400_visuals = None
+
     def _connect_signals(self):
         """Connects signals between different components of the application."""
-        if hasattr(self, "control_panel") and self.control_panel:
+        if self.control_panel is not None:
             logger.debug("Connecting control_panel signals")
             self.control_panel.scan_data_ready.connect(self._handle_scan_data)
-            self.control_panel.progress_updated.connect(
-                lambda value: self.statusBar().showMessage(f"Scan Progress: {value}%", 1000 if value < 100 else 0)
-            )
+            self.control_panel.progress_updated.connect(self._on_scan_progress)
         else:
             logger.warning("CT400 Control Panel not initialized, skipping signal connection.")
 
-        if hasattr(self, "histogram_control") and self.histogram_control:
+        if self.histogram_control is not None:
             logger.debug("Connecting histogram_control signals")
             self.histogram_control.power_data_ready.connect(self.handle_power_data)
         else:
-            logger.warning("Histogram Control Panel not initialized, skipping signal connection.")
+            logger.debug("Histogram Control Panel not built yet; it connects its signals when first shown.")
@@ -20,7 +20,7 @@ from PySide6.QtCore import (
     Signal,
     Slot,
 )
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -33,6 +33,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ui.icons import resource_icon
+
 try:
     import matlab.engine
 
@@ -376,13 +378,14 @@ class MatlabSaveWorker(QObject):
 class HistogramWidget(QtWidgets.QWidget):
     """
     Displays real-time power monitoring data as a histogram using PyQtGraph.
-    Updates are throttled for smooth performance. Expects power data as a dictionary.
+    Updates are throttled for smooth performance. Expects one float64 power per detector.
     """
 
     _UPDATE_INTERVAL_MS = 50
     _DEFAULT_Y_RANGE = (-70, 10)
     _LOW_SIGNAL_FLOOR = -100.0
     _HIGH_SIGNAL_CEILING = 10.0
+    _UNCHANGED_ATOL = 5e-5  # Samples within this of the previous one (dB) are treated as a repeat
 
     def __init__(self, control_panel, detector_keys: list[str], parent: QWidget | None = None):
         super().__init__(parent)
@@ -433,12 +436,17 @@ class HistogramWidget(QtWidgets.QWidget):
         self.reset_btn.clicked.connect(self.reset_maxima)
         self.layout.addWidget(self.reset_btn)
 
-        # Throttling for updates
-        self._pending_power_data: dict | None = None
+        # Throttling for updates: the first sample redraws immediately and opens a window of
+        # _UPDATE_INTERVAL_MS; samples arriving inside it are collapsed to the latest one.
+        # The single-shot timer only runs while data is flowing, so an idle tab costs no wakeups.
+        self._pending_power_data: np.ndarray | None = None
+        # Last accepted sample; steady-state repeats of it are dropped before they cost a redraw.
+        self._last_power_data: np.ndarray | None = None
         self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
         self._update_timer.setInterval(self._UPDATE_INTERVAL_MS)
-        self._update_timer.timeout.connect(self._process_pending_update)
-        self._is_visible = False  # To control timer activity
+        self._update_timer.timeout.connect(self._flush_throttled_update)
+        self._is_visible = False  # Updates are dropped while hidden
 
         # Pre-calculate bar x-positions for max lines
         self._bar_positions = [(i - self.bar_width / 2, i + self.bar_width / 2) for i in range(self.num_bars)]
@@ -506,13 +514,12 @@ class HistogramWidget(QtWidgets.QWidget):
     def showEvent(self, event: QtGui.QShowEvent):
         super().showEvent(event)
         self._is_visible = True
-        if not self._update_timer.isActive():
-            logger.debug("HistogramWidget visible, starting update timer.")
-            self._update_timer.start()
 
     def hideEvent(self, event: QtGui.QHideEvent):
         super().hideEvent(event)
         self._is_visible = False
+        self._pending_power_data = None
+        self._last_power_data = None
         if self._update_timer.isActive():
             logger.debug("HistogramWidget hidden, stopping update timer.")
             self._update_timer.stop()
@@ -524,6 +531,7 @@ class HistogramWidget(QtWidgets.QWidget):
 
         self.current_values.fill(0.0)
         self.max_values.fill(-np.inf)
+        self._last_power_data = None  # Redraw the next sample even if it repeats the last one
 
         if self.bars:
             self.bars.setOpts(height=self.current_values)
@@ -560,10 +568,30 @@ class HistogramWidget(QtWidgets.QWidget):
         t_end = time.perf_counter()
         logger.debug(f"Reset Axes execution took: {(t_end - t_start) * 1000:.3f} ms")
 
-    @Slot(dict)
-    def schedule_update(self, power_data: dict):
-        if self._is_visible:
-            self._pending_power_data = power_data
+    @Slot(np.ndarray)
+    def schedule_update(self, power_data: np.ndarray):
+        if not self._is_visible:
+            return
+        last = self._last_power_data
+        if (
+            last is not None
+            and last.shape == power_data.shape
+            and np.allclose(power_data, last, rtol=0.0, atol=self._UNCHANGED_ATOL, equal_nan=True)
+        ):
+            return
+        self._last_power_data = power_data
+        self._pending_power_data = power_data
+        if not self._update_timer.isActive():
+            # Leading edge: draw now, then throttle whatever arrives during the window.
+            self._process_pending_update()
+            self._update_timer.start()
+
+    @Slot()
+    def _flush_throttled_update(self):
+        """Draws the latest sample collected during the throttle window, if any."""
+        if self._pending_power_data is not None:
+            self._process_pending_update()
+            self._update_timer.start()
 
     @Slot()
     def _process_pending_update(self):
@@ -573,20 +601,13 @@ class HistogramWidget(QtWidgets.QWidget):
         data_to_process = self._pending_power_data
         self._pending_power_data = None
 
-        if not isinstance(data_to_process, dict):
-            logger.warning(f"HistogramWidget: Invalid power data type: {type(data_to_process)}")
+        if data_to_process.shape != (self.num_bars,):
+            logger.warning(f"HistogramWidget: Unexpected power data shape: {data_to_process.shape}")
             return
 
         try:
-            detector_values_from_signal = data_to_process.get("detectors", {})
-
-            new_values_from_signal = np.array(
-                [detector_values_from_signal.get(key, -np.inf) for key in self.detector_keys],
-                dtype=float,
-            )
-
             new_values_processed = np.nan_to_num(
-                new_values_from_signal,
+                data_to_process,
                 nan=self._LOW_SIGNAL_FLOOR,
                 posinf=self._HIGH_SIGNAL_CEILING,
                 neginf=self._LOW_SIGNAL_FLOOR,
@@ -751,6 +772,10 @@ class PlotWidget(QWidget):
 
         self.plot_widget = pg.PlotWidget(background="w")  # PyQtGraph PlotWidget
         self.plot_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        # Draw at most about one point per pixel column. 'peak' keeps narrow resonance dips visible;
+        # only the rendering is reduced, current_powers (and anything saved) stays full resolution.
+        self.plot_widget.getPlotItem().setDownsampling(auto=True, mode="peak")
+        self.plot_widget.getPlotItem().setClipToView(True)
         layout.addWidget(self.plot_widget)
 
         # --- NEW: Reference Plot Item (The "Frozen" Trace) ---
@@ -777,14 +802,14 @@ class PlotWidget(QWidget):
         # --- NEW: Clear Button ---
         self.clear_btn = QPushButton("Clear Plot")
         # Use standard Qt Trash icon
-        self.clear_btn.setIcon(QIcon(":/icons/eraser.svg"))
+        self.clear_btn.setIcon(resource_icon("eraser"))
         self.clear_btn.setToolTip("Clear all live and frozen traces")
         self.clear_btn.clicked.connect(self.clear_plot)
         # -------------------------
 
         # --- NEW: Freeze Button ---
         self.freeze_btn = QPushButton("Freeze Trace")
-        self.freeze_btn.setIcon(QIcon(":/icons/snowflake.svg"))
+        self.freeze_btn.setIcon(resource_icon("snowflake"))
         self.freeze_btn.setToolTip("Snapshot the current trace to the background for comparison")
         self.freeze_btn.clicked.connect(self.freeze_current_trace)
         self.freeze_btn.setEnabled(False)  # Disabled until we have data
@@ -803,7 +828,7 @@ class PlotWidget(QWidget):
         # PyQtGraph auto-ranges by default, which is often sufficient.
 
         self.save_btn = QPushButton("Save Scan Data")
-        self.save_btn.setIcon(QtGui.QIcon(":/icons/save.svg"))
+        self.save_btn.setIcon(resource_icon("save"))
         self.save_btn.setEnabled(False)
         self.save_btn.clicked.connect(self.save_scan_data)
 
@@ -922,7 +947,7 @@ class PlotWidget(QWidget):
                 self.save_btn.setEnabled(False)
                 return
 
-            logger.debug(f"Updating plot. Points: {len(x_data_np)}. Pout: {output_power}")
+            logger.debug("Updating plot. Points: %d. Pout: %s", len(x_data_np), output_power)
             self.current_wavelengths = x_data_np
             self.current_powers = y_data_np
             self.current_output_power = output_power
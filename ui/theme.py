@@ -2,16 +2,14 @@
 Global and component-specific stylesheets for the Lab Application.
 
 This module centralizes all Qt Style Sheets (QSS) used in the application.
-It uses a dynamic generation approach to combine readability and maintainability
-while ensuring the final QSS text is 100% identical to the original design specification.
+It uses a dynamic generation approach to combine readability and maintainability.
 
-The `_Theme` class contains a single, authoritative `TOKENS` dictionary that serves
-as the source of truth for all style values. The QSS constants are defined as
-templates that are populated from this dictionary.
-
-This approach provides the organizational benefits of a theme engine while
-preserving the exact, character-for-character output of the static stylesheet,
-including all conceptual `var()` comments and syntax.
+The `_Theme` class holds the design-system variables (`VARIABLES`, the values a CSS
+`:root` block would declare) and the `TOKENS` dictionary derived from them. The QSS
+constants are defined as templates that are populated from `TOKENS` once, at import.
+QSS has no `var()` support, so every variable is substituted with its literal value;
+the generated strings contain only plain colors and sizes that Qt's parser accepts.
+Comments and indentation are stripped from the generated strings as well.
 
 The public API consists of the generated stylesheet strings:
 - APP_STYLESHEET: The main, global stylesheet for the entire application.
@@ -19,6 +17,14 @@ The public API consists of the generated stylesheet strings:
 - CT400_CONTROL_PANEL_STYLE: A specific stylesheet for the CT400 Control Panel widgets.
 """
 
+import re
+
+# Minifier patterns. The templates never use a descendant selector followed by a bare pseudo-state
+# (`A :hover`), so dropping the space around ':' is safe alongside the other separators.
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_SPACE_RE = re.compile(r"\s*([{};:,>])\s*")
+
 
 class _Theme:
     """
@@ -27,46 +33,62 @@ class _Theme:
     """
 
     def __init__(self):
+        # --- DESIGN SYSTEM VARIABLES ---
+        # The literal values behind each conceptual `var(--name)`.
+        self.VARIABLES = {
+            # Primary color palette
+            "--primary-50": "#eff6ff",
+            "--primary-100": "#dbeafe",
+            "--primary-200": "#bfdbfe",
+            "--primary-300": "#93c5fd",
+            "--primary-400": "#60a5fa",
+            "--primary-500": "#3b82f6",
+            "--primary-600": "#2563eb",
+            "--primary-700": "#1d4ed8",
+            "--primary-800": "#1e40af",
+            "--primary-900": "#1e3a8a",
+            # Neutral color palette
+            "--neutral-50": "#f9fafb",
+            "--neutral-100": "#f3f4f6",
+            "--neutral-200": "#e5e7eb",
+            "--neutral-300": "#d1d5db",
+            "--neutral-400": "#9ca3af",
+            "--neutral-500": "#6b7280",
+            "--neutral-600": "#4b5563",
+            "--neutral-700": "#374151",
+            "--neutral-800": "#1f2937",
+            "--neutral-900": "#111827",
+            # Success and error states
+            "--success": "#10b981",
+            "--success-light": "#d1fae5",
+            "--error": "#ef4444",
+            "--error-light": "#fee2e2",
+            "--warning": "#f59e0b",
+            "--warning-light": "#fef3c7",
+            # Spacing system
+            "--space-xs": "4px",
+            "--space-sm": "8px",
+            "--space-md": "12px",
+            "--space-lg": "16px",
+            "--space-xl": "24px",
+            # Font sizes
+            "--font-xs": "12px",
+            "--font-sm": "14px",
+            "--font-md": "16px",
+            "--font-lg": "18px",
+            "--font-xl": "20px",
+            # Border radius
+            "--radius-sm": "4px",
+            "--radius-md": "6px",
+            "--radius-lg": "8px",
+            "--radius-full": "9999px",  # Used for pills/badges
+        }
+
         # --- DESIGN SYSTEM TOKENS ---
-        # A single, authoritative dictionary for all style values. This includes
-        # both conceptual `var(...)` strings and raw, hardcoded values.
+        # A single, authoritative dictionary for all template fields. Each variable is
+        # exposed as `c_<name>` (e.g. `--primary-500` -> `c_primary_500`) with its literal value.
         self.TOKENS = {
-            # --- Conceptual `var(...)` Variables ---
-            "c_primary_50": "var(--primary-50)",
-            "c_primary_100": "var(--primary-100)",
-            "c_primary_200": "var(--primary-200)",
-            "c_primary_300": "var(--primary-300)",
-            "c_primary_500": "var(--primary-500)",
-            "c_primary_600": "var(--primary-600)",
-            "c_primary_700": "var(--primary-700)",
-            "c_primary_800": "var(--primary-800)",
-            "c_neutral_50": "var(--neutral-50)",
-            "c_neutral_100": "var(--neutral-100)",
-            "c_neutral_200": "var(--neutral-200)",
-            "c_neutral_300": "var(--neutral-300)",
-            "c_neutral_400": "var(--neutral-400)",
-            "c_neutral_500": "var(--neutral-500)",
-            "c_neutral_600": "var(--neutral-600)",
-            "c_neutral_700": "var(--neutral-700)",
-            "c_neutral_800": "var(--neutral-800)",
-            "c_success": "var(--success)",
-            "c_success_light": "var(--success-light)",
-            "c_error": "var(--error)",
-            "c_error_light": "var(--error-light)",
-            "c_warning": "var(--warning)",
-            "c_warning_light": "var(--warning-light)",
-            "c_space_xs": "var(--space-xs)",
-            "c_space_sm": "var(--space-sm)",
-            "c_space_md": "var(--space-md)",
-            "c_space_lg": "var(--space-lg)",
-            "c_font_xs": "var(--font-xs)",
-            "c_font_sm": "var(--font-sm)",
-            "c_font_md": "var(--font-md)",
-            "c_font_lg": "var(--font-lg)",
-            "c_radius_sm": "var(--radius-sm)",
-            "c_radius_md": "var(--radius-md)",
-            "c_radius_lg": "var(--radius-lg)",
-            "c_radius_full": "var(--radius-full)",
+            **{"c_" + name[2:].replace("-", "_"): value for name, value in self.VARIABLES.items()},
             # --- Raw Values and Specific Overrides ---
             "white": "white",
             "transparent": "transparent",
@@ -93,76 +115,25 @@ class _Theme:
         }
 
     def _generate(self, template: str) -> str:
-        """Populates a QSS template string with variables from the TOKENS dictionary."""
-        return template.format(**self.TOKENS)
+        """Populates a QSS template string with variables from the TOKENS dictionary, then minifies it."""
+        return self._minify(template.format(**self.TOKENS))
+
+    @staticmethod
+    def _minify(qss: str) -> str:
+        """
+        Strips comments and collapses whitespace so Qt tokenizes as little text as possible.
+        The templates stay readable; only the generated strings handed to Qt are compacted.
+        """
+        qss = _COMMENT_RE.sub("", qss)
+        qss = _WHITESPACE_RE.sub(" ", qss)
+        qss = _PUNCTUATION_SPACE_RE.sub(r"\1", qss)
+        return qss.strip()
 
 
 # --- QSS TEMPLATES ---
 # NOTE: Literal curly braces `{` and `}` in QSS must be escaped as `{{` and `}}`.
 
 _APP_STYLESHEET_TEMPLATE = """
-/* ----------------------------------------
-   Design System Variables (Conceptual)
------------------------------------------
-   NOTE: QSS does not support CSS variables (`var(...)`).
-   These are defined here for clarity and maintainability.
-   Use find/replace or consider a QSS pre-processor (like qtsass)
-   if extensive theming or easier refactoring is needed.
------------------------------------------ */
-:root {{
-    /* Primary color palette */
-    --primary-50: #eff6ff;
-    --primary-100: #dbeafe;
-    --primary-200: #bfdbfe;
-    --primary-300: #93c5fd;
-    --primary-400: #60a5fa;
-    --primary-500: #3b82f6;
-    --primary-600: #2563eb;
-    --primary-700: #1d4ed8;
-    --primary-800: #1e40af;
-    --primary-900: #1e3a8a;
-
-    /* Neutral color palette */
-    --neutral-50: #f9fafb;
-    --neutral-100: #f3f4f6;
-    --neutral-200: #e5e7eb;
-    --neutral-300: #d1d5db;
-    --neutral-400: #9ca3af;
-    --neutral-500: #6b7280;
-    --neutral-600: #4b5563;
-    --neutral-700: #374151;
-    --neutral-800: #1f2937;
-    --neutral-900: #111827;
-
-    /* Success and error states */
-    --success: #10b981;
-    --success-light: #d1fae5;
-    --error: #ef4444;
-    --error-light: #fee2e2;
-    --warning: #f59e0b;
-    --warning-light: #fef3c7;
-
-    /* Spacing system */
-    --space-xs: 4px;
-    --space-sm: 8px;
-    --space-md: 12px;
-    --space-lg: 16px;
-    --space-xl: 24px;
-
-    /* Font sizes */
-    --font-xs: 12px;
-    --font-sm: 14px;
-    --font-md: 16px;
-    --font-lg: 18px;
-    --font-xl: 20px;
-
-    /* Border radius */
-    --radius-sm: 4px;
-    --radius-md: 6px;
-    --radius-lg: 8px;
-    --radius-full: 9999px; /* Used for pills/badges */
-}}
-
 /* ----------------------------------------
    General Widget Styling
 ----------------------------------------- */